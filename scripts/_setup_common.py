@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+File helpers shared by the Windows setup scripts
+Used by setup-windows-fixed.py and quick-setup-skip-db.py
+"""
+
+import os
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_file_atomic(path: str, content: str, encoding: str = 'utf-8') -> bool:
+    """Encode content once up front and write it via a temp file, then swap it into place
+
+    An interrupted run leaves either the old file or the new one, never a partial one.
+    Returns False without touching the file when it already holds exactly this content.
+    """
+    data = content.encode(encoding)
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    
+    temp_path = f"{path}.tmp"
+    Path(temp_path).write_bytes(data)
+    os.replace(temp_path, path)
+    return True
+
+def load_json_file(path: str):
+    """Parse a JSON file, with orjson when it is installed"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def format_json(data) -> str:
+    """Serialize with 2-space indentation; orjson and json produce the same text here"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
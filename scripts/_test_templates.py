@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Node test script templates shared by the Windows setup scripts
+Written to scripts/test-db.js and scripts/test-ai.js (ASCII safe content)
+"""
+
+TEST_DB_JS = '''import { drizzle } from 'drizzle-orm/neon-http';
+import { neon } from '@neondatabase/serverless';
+import 'dotenv/config';
+
+async function testDatabase() {
+    try {
+        const sql = neon(process.env.DATABASE_URL);
+        const db = drizzle(sql);
+        
+        // Test connection
+        const result = await sql`SELECT 1 as test`;
+        console.log('[OK] Database connection successful');
+        
+        // Test basic query
+        const version = await sql`SELECT version()`;
+        console.log('[OK] Database version verified');
+        
+    } catch (error) {
+        console.error('[FAIL] Database connection failed:', error.message);
+        process.exit(1);
+    }
+}
+
+testDatabase();'''
+
+TEST_AI_JS = '''import 'dotenv/config';
+
+async function testAI() {
+    try {
+        if (process.env.OPENAI_API_KEY) {
+            const { default: OpenAI } = await import('openai');
+            const openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
+            
+            const response = await openai.chat.completions.create({
+                model: 'gpt-4o',
+                messages: [{ role: 'user', content: 'Say "OpenAI connection successful"' }],
+                max_tokens: 10
+            });
+            
+            console.log('[OK] OpenAI connection successful');
+            console.log('Response:', response.choices[0].message.content);
+        }
+        
+        if (process.env.GEMINI_API_KEY) {
+            const { GoogleGenAI } = await import('@google/genai');
+            const genAI = new GoogleGenAI({ apiKey: process.env.GEMINI_API_KEY });
+            
+            const response = await genAI.models.generateContent({
+                model: 'gemini-2.5-flash',
+                contents: 'Say "Gemini connection successful"'
+            });
+            
+            console.log('[OK] Gemini connection successful');
+            console.log('Response:', response.text);
+        }
+        
+        if (!process.env.OPENAI_API_KEY && !process.env.GEMINI_API_KEY) {
+            console.log('[INFO] No AI API keys configured');
+        }
+        
+    } catch (error) {
+        console.error('[FAIL] AI service test failed:', error.message);
+    }
+}
+
+testAI();'''
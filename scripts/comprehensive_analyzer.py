@@ -12,10 +12,262 @@ import hashlib
 import subprocess
 import shutil
 import sys
+from stat import S_ISREG
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import re
+import xml.etree.ElementTree as ET
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files larger than this (lockfiles, bundles) are only partially read
+MAX_SCAN_BYTES = 1024 * 1024
+
+# File reads are prefetched by a thread pool, running at most PREFETCH_WINDOW files ahead
+PREFETCH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+PREFETCH_WINDOW = 64
+
+# Per-project cache directory for results that can be reused across runs
+CACHE_DIR_NAME = '.leviatan_cache'
+MANIFEST_CACHE_VERSION = 2
+
+# Entry-point scripts whose presence analyze_pip_dependencies turns into run commands
+PYTHON_ENTRY_POINTS = ('app.py', 'main.py', 'manage.py')
+
+ANALYZABLE_EXTENSIONS = frozenset({
+    '.js', '.ts', '.jsx', '.tsx', '.py', '.java', '.cpp', '.c', '.h',
+    '.cs', '.php', '.rb', '.go', '.rs', '.swift', '.kt', '.scala',
+    '.css', '.scss', '.sass', '.less', '.html', '.htm', '.xml', '.svg',
+    '.json', '.md', '.txt', '.yaml', '.yml', '.toml', '.ini', '.conf',
+    '.config', '.sql', '.sh', '.bat', '.ps1', '.cmd', '.dockerfile',
+    '.vue', '.svelte', '.elm', '.clj', '.hs', '.ml', '.fs', '.dart',
+    '.r', '.jl', '.lua', '.pl', '.tcl', '.vim', '.tex'
+})
+ANALYZABLE_FILENAMES = frozenset({'dockerfile', 'makefile', 'rakefile', 'gemfile'})
+
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp'})
+
+# go.mod lines that never declare a dependency
+GO_MOD_SKIP_PREFIXES = ('module', 'go ', '//')
+
+# Dependency names matching this are reported as authentication/security related
+AUTH_DEPENDENCY_RE = re.compile(r'auth|passport|jwt|bcrypt|crypto', re.IGNORECASE)
+
+# Indicators used by detect_project_type, matched case-insensitively
+PROJECT_TYPE_INDICATORS = {
+    "Web Application": [
+        'package.json', 'index.html', 'React', 'Vue.js', 'Angular', 'Express.js',
+        'Next.js', 'Nuxt.js', 'Gatsby', 'Svelte'
+    ],
+    "API/Backend Service": [
+        'Express.js', 'Django', 'Flask', 'FastAPI', 'Spring Framework',
+        'routes/', 'controllers/', 'api/', '/api'
+    ],
+    "Full-Stack Application": [
+        'React', 'Vue.js', 'Angular', 'Express.js', 'Django', 'Flask',
+        'client/', 'server/', 'backend/', 'frontend/'
+    ],
+    "Desktop Application": [
+        'electron', 'tauri', 'PyQt', 'tkinter', '.exe'
+    ],
+    "Mobile Application": [
+        'React Native', 'Flutter', 'Ionic', 'android/', 'ios/'
+    ],
+    "Library/Package": [
+        'setup.py', 'pyproject.toml', 'lib/', 'src/', 'index.js'
+    ],
+    "Documentation": [
+        'docs/', 'README.md', '.md', 'jekyll', 'hugo'
+    ],
+    "Development Environment": [
+        'IDE', 'development environment', 'code editor', 'Monaco', 'AI'
+    ]
+}
+_PROJECT_TYPE_INDICATORS_LOWER = {
+    project_type: tuple(indicator.lower() for indicator in indicators)
+    for project_type, indicators in PROJECT_TYPE_INDICATORS.items()
+}
+# Highest score still reachable by the project types after each position, for early exit
+_PROJECT_TYPE_REMAINING_MAX = tuple(
+    max((len(indicators) for indicators in list(_PROJECT_TYPE_INDICATORS_LOWER.values())[i + 1:]), default=0)
+    for i in range(len(_PROJECT_TYPE_INDICATORS_LOWER))
+)
+
+# (name, weight, description, check) for calculate_quality_metrics; checks take the analyzer
+QUALITY_FACTORS = (
+    ("hasTests", 0.25, "Automated testing implementation",
+     lambda analyzer: len(analyzer.insights_data["testFiles"]) > 0),
+    ("hasDocumentation", 0.15, "Project documentation",
+     lambda analyzer: len(analyzer.insights_data["documentationFiles"]) > 0),
+    ("hasGit", 0.10, "Version control usage",
+     lambda analyzer: analyzer.insights_data["gitInfo"]["isGitRepo"]),
+    ("hasBuildSystem", 0.15, "Build system implementation",
+     lambda analyzer: len(analyzer.insights_data["buildSystems"]) > 0),
+    ("moderateDependencies", 0.10, "Reasonable dependency count",
+     lambda analyzer: analyzer._total_deps < 150),
+    ("hasFrameworks", 0.10, "Modern framework usage",
+     lambda analyzer: len(analyzer.insights_data["frameworks"]) > 0),
+    ("goodFileOrganization", 0.10, "File organization and structure",
+     lambda analyzer: analyzer.insights_data["totalFiles"] > 5 and len(analyzer.insights_data["fileTypes"]) > 2),
+    ("hasTypeScript", 0.05, "Type safety implementation",
+     lambda analyzer: 'typescript' in analyzer._tech_set),
+)
+QUALITY_TOTAL_WEIGHT = sum(weight for _, weight, _, _ in QUALITY_FACTORS)
+
+# Recommendation added when a quality factor fails (factors without an entry add none)
+QUALITY_RECOMMENDATIONS = {
+    "hasTests": "Implement automated testing with a testing framework",
+    "hasDocumentation": "Add comprehensive project documentation",
+    "hasGit": "Initialize Git repository for version control",
+    "hasBuildSystem": "Implement a build system for consistent builds",
+    "hasFrameworks": "Consider adopting modern frameworks for better development experience",
+}
+
+# Shared HTTP session so repeated AI calls reuse the TLS connection (created on first use)
+_http_session = None
+
+
+def get_http_session():
+    """Return the module-wide requests session, creating it lazily."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        _http_session = requests.Session()
+    return _http_session
+
+
+def prefetch(func, items):
+    """Yield (item, future) in order while a thread pool runs func on the items ahead.
+
+    File reads release the GIL, so disk I/O for upcoming files overlaps the
+    caller's processing of the current one.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append((item, executor.submit(func, item)))
+                if len(pending) >= PREFETCH_WINDOW:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            # Caller stopped early: drop reads that have not started yet
+            for _, future in pending:
+                future.cancel()
+
+
+def write_json_file(path: Path, data: Any):
+    """Write data as indented UTF-8 JSON, serializing with orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} block in text, skipping braces inside strings."""
+    start = text.find('{')
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    # Unbalanced (e.g. truncated output): fall back to the widest {...} span
+    match = _JSON_OBJECT_RE.search(text)
+    return match.group() if match else None
+
+
+class OrderedUniqueList(list):
+    """List that keeps insertion order and silently skips items it already holds."""
+
+    def __init__(self, items=()):
+        super().__init__()
+        self._seen = set()
+        self.extend(items)
+
+    def append(self, item):
+        if item not in self._seen:
+            self._seen.add(item)
+            super().append(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __contains__(self, item):
+        return item in self._seen
+
+
+class FileInfo:
+    """Per-file scan record for fileStructure; serialized via to_dict()."""
+    __slots__ = ("size", "lines", "extension", "language", "modified")
+
+    def __init__(self, size: int, lines: int, extension: str, language: str, modified: float):
+        self.size = size
+        self.lines = lines
+        self.extension = extension
+        self.language = language
+        self.modified = modified
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "lines": self.lines,
+            "extension": self.extension,
+            "language": self.language,
+            "modified": datetime.fromtimestamp(self.modified).isoformat()
+        }
+
+
+class ImportantFileInfo:
+    """Per-file record for importantFiles; serialized via to_dict()."""
+    __slots__ = ("type", "size", "modified")
+
+    def __init__(self, type: str, size: int, modified: float):
+        self.type = type
+        self.size = size
+        self.modified = modified
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "size": self.size,
+            "modified": datetime.fromtimestamp(self.modified).isoformat()
+        }
+
 
 class ComprehensiveProjectAnalyzer:
     def __init__(self, project_path: str = ".", api_key: str = None):
@@ -23,15 +275,29 @@ class ComprehensiveProjectAnalyzer:
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         self.start_time = datetime.now()
         
+        # Sum of total_count across all manifests, set once dependency analysis completes
+        self._total_deps = 0
+        
+        # Lowercased detected technologies for O(1) membership checks
+        self._tech_set = set()
+        
+        # Lowercased dependency names (runtime and dev) across all manifests
+        self._all_dep_names = set()
+        
+        # fileStructure aggregates, accumulated while scanning so metrics need no extra pass
+        self._structure_total_size = 0
+        self._structure_non_empty_files = 0
+        
         # Initialize comprehensive analysis data structure matching insightsproject.ia format
+        started_at = self.start_time.isoformat()
         self.insights_data = {
             "version": "1.0",
             "projectId": self.project_path.name,
             "projectName": self.project_path.name,
             "projectPath": str(self.project_path),
-            "createdAt": self.start_time.isoformat(),
-            "lastModified": self.start_time.isoformat(),
-            "lastAnalyzed": self.start_time.isoformat(),
+            "createdAt": started_at,
+            "lastModified": started_at,
+            "lastAnalyzed": started_at,
             
             # Core project data
             "technologies": [],
@@ -45,14 +311,14 @@ class ComprehensiveProjectAnalyzer:
             # Architecture and structure
             "projectType": "",
             "mainEntryPoints": [],
-            "configFiles": [],
+            "configFiles": OrderedUniqueList(),
             "buildSystems": [],
             "testingFrameworks": [],
             "cicdPipelines": [],
             
             # Analysis results
             "insights": [],
-            "recommendations": [],
+            "recommendations": OrderedUniqueList(),
             "securityFindings": [],
             "performanceInsights": [],
             "codeQualityMetrics": {},
@@ -65,8 +331,8 @@ class ComprehensiveProjectAnalyzer:
             "aiPerformanceAnalysis": "",
             
             # Setup and deployment
-            "setupInstructions": [],
-            "runCommands": [],
+            "setupInstructions": OrderedUniqueList(),
+            "runCommands": OrderedUniqueList(),
             "deploymentInfo": {
                 "type": "",
                 "requirements": [],
@@ -106,20 +372,55 @@ class ComprehensiveProjectAnalyzer:
             }
         }
 
-    def is_analyzable_file(self, file_path: Path) -> bool:
+    def is_analyzable_file(self, name_lower: str, ext_lower: str) -> bool:
         """Check if file should be analyzed for code content."""
-        analyzable_extensions = {
-            '.js', '.ts', '.jsx', '.tsx', '.py', '.java', '.cpp', '.c', '.h',
-            '.cs', '.php', '.rb', '.go', '.rs', '.swift', '.kt', '.scala',
-            '.css', '.scss', '.sass', '.less', '.html', '.htm', '.xml', '.svg',
-            '.json', '.md', '.txt', '.yaml', '.yml', '.toml', '.ini', '.conf',
-            '.config', '.sql', '.sh', '.bat', '.ps1', '.cmd', '.dockerfile',
-            '.vue', '.svelte', '.elm', '.clj', '.hs', '.ml', '.fs', '.dart',
-            '.r', '.jl', '.lua', '.pl', '.tcl', '.vim', '.tex'
-        }
+        return ext_lower in ANALYZABLE_EXTENSIONS or name_lower in ANALYZABLE_FILENAMES
+
+    def iter_project_files(self, ignore_patterns):
+        """Yield (path, name, stat) for every project file outside ignored directories."""
+        # Fast path: let git list tracked and untracked-but-not-ignored files in one call
+        if (self.project_path / ".git").exists():
+            try:
+                result = subprocess.run(['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+                                      capture_output=True, cwd=self.project_path, timeout=30)
+                if result.returncode == 0:
+                    for raw_path in result.stdout.split(b'\0'):
+                        if not raw_path:
+                            continue
+                        parts = os.fsdecode(raw_path).split('/')
+                        if any(part in ignore_patterns for part in parts[:-1]):
+                            continue
+                        file_path = self.project_path.joinpath(*parts)
+                        try:
+                            stat = file_path.stat()
+                        except OSError:
+                            continue  # listed in the index but deleted from the work tree
+                        if not S_ISREG(stat.st_mode):
+                            continue  # submodule gitlink or symlink to a directory, skipped by the walk too
+                        yield file_path, parts[-1], stat
+                    return
+            except (OSError, subprocess.SubprocessError):
+                pass
         
-        return (file_path.suffix.lower() in analyzable_extensions or 
-                file_path.name.lower() in ['dockerfile', 'makefile', 'rakefile', 'gemfile'])
+        # Fallback: scandir walk in os.walk's top-down order, reusing each entry's cached stat
+        # (free on Windows, where readdir already returns it)
+        stack = [str(self.project_path)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                if entry.name not in ignore_patterns and not entry.is_symlink():
+                                    subdirs.append(entry.path)
+                            else:
+                                yield Path(entry.path), entry.name, entry.stat()
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
 
     def scan_comprehensive_files(self):
         """Comprehensive file scanning with detailed analysis."""
@@ -129,7 +430,8 @@ class ComprehensiveProjectAnalyzer:
             'node_modules', '.git', '__pycache__', '.venv', 'venv', 'env',
             'dist', 'build', '.next', 'target', 'bin', 'obj', 'out',
             '.idea', '.vscode', '.vs', '.nyc_output', 'coverage',
-            'logs', 'uploads', 'migrations'  # Added common project folders to ignore
+            'logs', 'uploads', 'migrations',  # Added common project folders to ignore
+            CACHE_DIR_NAME
         }
         
         important_files = {
@@ -152,69 +454,71 @@ class ComprehensiveProjectAnalyzer:
         
         file_count = 0
         total_lines = 0
+        file_types = Counter()
         
-        for root, dirs, files in os.walk(self.project_path):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if d not in ignore_patterns]
+        def count_lines(item):
+            # Runs in the prefetch pool; None for files that are not analyzed
+            file_path, file, stat = item
+            if not self.is_analyzable_file(file.lower(), file_path.suffix.lower()):
+                return None
+            # Lines are counted on raw bytes, skipping the UTF-8 decode and splitlines list
+            with open(file_path, 'rb') as f:
+                head = f.read(MAX_SCAN_BYTES)
+            if stat.st_size > MAX_SCAN_BYTES:
+                # Estimate line count from the newline density of the first chunk
+                return round(head.count(b'\n') / max(len(head), 1) * stat.st_size)
+            return head.count(b'\n') + (1 if head and not head.endswith(b'\n') else 0)
+        
+        for (file_path, file, stat), lines_future in prefetch(count_lines, self.iter_project_files(ignore_patterns)):
+            relative_path = str(file_path.relative_to(self.project_path))
             
-            for file in files:
-                if any(pattern in file for pattern in ignore_patterns if '*' not in pattern):
-                    continue
-                    
-                file_path = Path(root) / file
-                relative_path = str(file_path.relative_to(self.project_path))
+            try:
+                ext = file_path.suffix.lower()
                 
-                try:
-                    stat = file_path.stat()
-                    ext = file_path.suffix.lower()
-                    
-                    # Count file types
-                    self.insights_data["fileTypes"][ext] = self.insights_data["fileTypes"].get(ext, 0) + 1
-                    
-                    # Categorize files
-                    if file in important_files:
-                        self.insights_data["importantFiles"][relative_path] = {
-                            "type": "configuration",
-                            "size": stat.st_size,
-                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                        }
-                        self.insights_data["configFiles"].append(relative_path)
-                    
-                    if file in entry_point_patterns:
-                        self.insights_data["mainEntryPoints"].append(relative_path)
-                    
-                    if ('test' in relative_path.lower() or 
-                        file.lower().endswith(('.test.js', '.test.ts', '.spec.js', '.spec.ts', '_test.py')) or
-                        'test' in file.lower()):
-                        self.insights_data["testFiles"].append(relative_path)
-                    
-                    if file.lower().endswith(('.md', '.txt', '.rst', '.adoc', '.doc')):
-                        self.insights_data["documentationFiles"].append(relative_path)
-                    
-                    # Analyze text files
-                    if self.is_analyzable_file(file_path):
-                        try:
-                            content = file_path.read_text(encoding='utf-8', errors='ignore')
-                            lines = len(content.splitlines())
-                            total_lines += lines
-                            
-                            # Store file structure info
-                            self.insights_data["fileStructure"][relative_path] = {
-                                "size": stat.st_size,
-                                "lines": lines,
-                                "extension": ext,
-                                "language": self.detect_file_language(ext),
-                                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                            }
-                            
-                        except (UnicodeDecodeError, PermissionError):
-                            continue
-                    
-                    file_count += 1
-                    
-                except (OSError, PermissionError):
-                    continue
+                # Count file types
+                file_types[ext] += 1
+                
+                # Categorize files
+                if file in important_files:
+                    self.insights_data["importantFiles"][relative_path] = ImportantFileInfo(
+                        "configuration", stat.st_size, stat.st_mtime
+                    )
+                    self.insights_data["configFiles"].append(relative_path)
+                
+                if file in entry_point_patterns:
+                    self.insights_data["mainEntryPoints"].append(relative_path)
+                
+                if ('test' in relative_path.lower() or 
+                    file.lower().endswith(('.test.js', '.test.ts', '.spec.js', '.spec.ts', '_test.py')) or
+                    'test' in file.lower()):
+                    self.insights_data["testFiles"].append(relative_path)
+                
+                if file.lower().endswith(('.md', '.txt', '.rst', '.adoc', '.doc')):
+                    self.insights_data["documentationFiles"].append(relative_path)
+                
+                # Analyze text files
+                if self.is_analyzable_file(file.lower(), ext):
+                    try:
+                        lines = lines_future.result()
+                        total_lines += lines
+                        
+                        # Store file structure info
+                        self.insights_data["fileStructure"][relative_path] = FileInfo(
+                            stat.st_size, lines, ext, self.detect_file_language(ext), stat.st_mtime
+                        )
+                        self._structure_total_size += stat.st_size
+                        if lines > 0:
+                            self._structure_non_empty_files += 1
+                        
+                    except (UnicodeDecodeError, PermissionError):
+                        continue
+                
+                file_count += 1
+                
+            except (OSError, PermissionError):
+                continue
         
+        self.insights_data["fileTypes"] = dict(file_types)
         self.insights_data["totalFiles"] = file_count
         self.insights_data["totalLinesOfCode"] = total_lines
         
@@ -378,62 +682,82 @@ class ComprehensiveProjectAnalyzer:
             'Shopify': [r'"@shopify":', r'shopify']
         }
         
+        # Patterns are matched against lowercased raw bytes without IGNORECASE, which keeps
+        # re's literal-prefix fast search and skips decoding file contents. All patterns
+        # are ASCII and none use uppercase escapes like \S, so lowering them is safe.
+        compiled_patterns = {
+            tech: [re.compile(pattern.lower().encode('ascii'), re.MULTILINE) for pattern in patterns]
+            for tech, patterns in tech_patterns.items()
+        }
+        
         detected_techs = set()
         detected_frameworks = set()
         detected_languages = set()
         detected_build_systems = set()
         detected_testing = set()
         
-        # Analyze all files for technology patterns
-        all_content = ""
-        all_filenames = ""
+        def scan_text(text: bytes):
+            text = text.lower()
+            # Only technologies not yet detected are tested; once found, a tech costs nothing
+            for tech, patterns in compiled_patterns.items():
+                if tech not in detected_techs and any(pattern.search(text) for pattern in patterns):
+                    detected_techs.add(tech)
+        
+        # File names (including config files) are scanned together first
+        scan_text(" ".join(list(self.insights_data["fileStructure"]) + self.insights_data["configFiles"])
+                  .encode('utf-8', errors='surrogateescape'))
         
-        for file_path in self.insights_data["fileStructure"]:
-            all_filenames += f" {file_path} "
+        # Then each file's content on its own, stopping once every technology is found.
+        # fileStructure only holds analyzable files, so no extension check is needed.
+        # Detection only ever adds technologies, so a file whose content was already
+        # scanned (vendored copies, generated duplicates) cannot find anything new.
+        def read_file(file_path):
+            # Runs in the prefetch pool; hashing large buffers also releases the GIL
+            with open(self.project_path / file_path, 'rb') as f:
+                data = f.read(MAX_SCAN_BYTES)
+            return data, hashlib.blake2b(data, digest_size=16).digest()
+        
+        seen_digests = set()
+        for file_path, read_future in prefetch(read_file, self.insights_data["fileStructure"]):
+            if len(detected_techs) == len(compiled_patterns):
+                break
             try:
-                actual_path = self.project_path / file_path
-                if actual_path.exists() and self.is_analyzable_file(actual_path):
-                    content = actual_path.read_text(encoding='utf-8', errors='ignore')
-                    all_content += f" {content} "
+                data, digest = read_future.result()
+                if digest in seen_digests:
+                    continue
+                seen_digests.add(digest)
+                if b'\r' in data:
+                    # Same newline translation as text-mode reads, so '$' anchors behave as before
+                    data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                scan_text(data)
             except:
                 continue
         
-        # Add config files
-        for file_path in self.insights_data["configFiles"]:
-            all_filenames += f" {file_path} "
+        # Categorize technologies
+        frontend_frameworks = ['React', 'Vue.js', 'Angular', 'Svelte', 'Next.js', 'Nuxt.js', 'Gatsby']
+        backend_frameworks = ['Express.js', 'Fastify', 'Koa', 'Django', 'Flask', 'FastAPI', 'Spring Framework', 'ASP.NET', 'Ruby on Rails']
+        languages = ['JavaScript', 'TypeScript', 'Python', 'Java', 'C#', 'C++', 'Go', 'Rust', 'PHP', 'Ruby', 'Swift', 'Kotlin', 'Dart']
+        build_systems = ['Webpack', 'Vite', 'Rollup', 'Parcel', 'npm', 'Yarn', 'pnpm', 'pip', 'Poetry', 'Maven', 'Gradle', 'Make', 'Cargo']
+        testing_frameworks = ['Jest', 'Mocha', 'Cypress', 'PyTest', 'JUnit']
         
-        search_text = all_filenames + " " + all_content
-        
-        # Detect technologies
-        for tech, patterns in tech_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, search_text, re.IGNORECASE | re.MULTILINE):
-                    detected_techs.add(tech)
-                    
-                    # Categorize technologies
-                    frontend_frameworks = ['React', 'Vue.js', 'Angular', 'Svelte', 'Next.js', 'Nuxt.js', 'Gatsby']
-                    backend_frameworks = ['Express.js', 'Fastify', 'Koa', 'Django', 'Flask', 'FastAPI', 'Spring Framework', 'ASP.NET', 'Ruby on Rails']
-                    languages = ['JavaScript', 'TypeScript', 'Python', 'Java', 'C#', 'C++', 'Go', 'Rust', 'PHP', 'Ruby', 'Swift', 'Kotlin', 'Dart']
-                    build_systems = ['Webpack', 'Vite', 'Rollup', 'Parcel', 'npm', 'Yarn', 'pnpm', 'pip', 'Poetry', 'Maven', 'Gradle', 'Make', 'Cargo']
-                    testing_frameworks = ['Jest', 'Mocha', 'Cypress', 'PyTest', 'JUnit']
-                    
-                    if tech in frontend_frameworks or tech in backend_frameworks:
-                        detected_frameworks.add(tech)
-                    elif tech in languages:
-                        detected_languages.add(tech)
-                    elif tech in build_systems:
-                        detected_build_systems.add(tech)
-                    elif tech in testing_frameworks:
-                        detected_testing.add(tech)
-                    break
+        for tech in detected_techs:
+            if tech in frontend_frameworks or tech in backend_frameworks:
+                detected_frameworks.add(tech)
+            elif tech in languages:
+                detected_languages.add(tech)
+            elif tech in build_systems:
+                detected_build_systems.add(tech)
+            elif tech in testing_frameworks:
+                detected_testing.add(tech)
         
         self.insights_data["technologies"] = sorted(list(detected_techs))
+        self._tech_set = {tech.lower() for tech in detected_techs}
         self.insights_data["frameworks"] = sorted(list(detected_frameworks))
         self.insights_data["languages"] = sorted(list(detected_languages))
         self.insights_data["buildSystems"] = sorted(list(detected_build_systems))
         self.insights_data["testingFrameworks"] = sorted(list(detected_testing))
         
-        print(f"🔍 Detected {len(detected_techs)} technologies: {', '.join(sorted(list(detected_techs))[:10])}{'...' if len(detected_techs) > 10 else ''}")
+        print(f"🔍 Detected {len(detected_techs)} technologies: {', '.join(self.insights_data['technologies'][:10])}{'...' if len(detected_techs) > 10 else ''}")
 
     def analyze_dependencies_comprehensive(self):
         """Comprehensive dependency analysis for all package managers."""
@@ -451,17 +775,84 @@ class ComprehensiveProjectAnalyzer:
             'go.mod': self.analyze_go_dependencies
         }
         
-        for filename, analyzer in dependency_analyzers.items():
-            file_path = self.project_path / filename
-            if file_path.exists():
+        manifests = [
+            (filename, analyzer, self.project_path / filename)
+            for filename, analyzer in dependency_analyzers.items()
+            if (self.project_path / filename).exists()
+        ]
+        if not manifests:
+            return
+        
+        # Manifests unchanged since the last run (same mtime, size and entry points) reuse the cached parse
+        cache_path = self.project_path / CACHE_DIR_NAME / "manifests.json"
+        cache = self.load_manifest_cache(cache_path)
+        new_cache = {}
+        # Run commands also depend on which entry-point scripts exist, not just the manifest
+        entry_points = [name for name in PYTHON_ENTRY_POINTS if (self.project_path / name).exists()]
+        
+        # Analyzers are independent, so run them concurrently. Each gets its own
+        # command collector; results are merged in manifest order to keep output stable.
+        with ThreadPoolExecutor(max_workers=len(manifests)) as executor:
+            futures = []
+            for filename, analyzer, file_path in manifests:
                 try:
-                    deps = analyzer(file_path)
-                    if deps:
-                        self.insights_data["dependencies"][filename] = deps
-                except Exception as e:
-                    print(f"⚠️  Could not analyze {filename}: {e}")
+                    stat = file_path.stat()
+                    cache_key = [stat.st_mtime_ns, stat.st_size, entry_points]
+                except OSError:
+                    cache_key = None
+                cached = cache.get(filename)
+                if cache_key and cached and cached.get("key") == cache_key:
+                    futures.append((filename, cached["commands"], cache_key, None, cached["deps"]))
+                    continue
+                commands = {"setupInstructions": [], "runCommands": []}
+                futures.append((filename, commands, cache_key, executor.submit(analyzer, file_path, commands), None))
+        
+        for filename, commands, cache_key, future, cached_deps in futures:
+            try:
+                deps = cached_deps if future is None else future.result()
+                if cache_key:
+                    new_cache[filename] = {"key": cache_key, "deps": deps, "commands": commands}
+                if deps:
+                    self.insights_data["dependencies"][filename] = deps
+                self.insights_data["setupInstructions"].extend(commands["setupInstructions"])
+                self.insights_data["runCommands"].extend(commands["runCommands"])
+            except Exception as e:
+                print(f"⚠️  Could not analyze {filename}: {e}")
+        
+        if new_cache != cache:
+            self.save_manifest_cache(cache_path, new_cache)
+        
+        self._total_deps = sum(deps.get('total_count', 0) for deps in self.insights_data["dependencies"].values())
+        for deps in self.insights_data["dependencies"].values():
+            for key in ('dependencies', 'devDependencies'):
+                names = deps.get(key)
+                if isinstance(names, dict):
+                    self._all_dep_names.update(name.lower() for name in names)
 
-    def analyze_npm_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def load_manifest_cache(self, cache_path: Path) -> Dict[str, Any]:
+        """Load cached manifest parses, ignoring missing or outdated cache files."""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get("version") == MANIFEST_CACHE_VERSION:
+                return cache.get("manifests", {})
+        except:
+            pass
+        return {}
+
+    def save_manifest_cache(self, cache_path: Path, manifests: Dict[str, Any]):
+        """Persist manifest parses for the next run; failures only cost a re-parse."""
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            gitignore = cache_path.parent / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("*\n")
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": MANIFEST_CACHE_VERSION, "manifests": manifests}, f)
+        except OSError:
+            pass
+
+    def analyze_npm_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze npm package.json dependencies."""
         try:
             data = json.loads(file_path.read_text())
@@ -476,23 +867,23 @@ class ComprehensiveProjectAnalyzer:
             # Extract setup and run commands
             scripts = data.get('scripts', {})
             if 'start' in scripts:
-                self.insights_data["runCommands"].append("npm start")
+                commands["runCommands"].append("npm start")
             if 'dev' in scripts:
-                self.insights_data["runCommands"].append("npm run dev")
+                commands["runCommands"].append("npm run dev")
             if 'windev' in scripts:
-                self.insights_data["runCommands"].append("npm run windev")
+                commands["runCommands"].append("npm run windev")
             if 'build' in scripts:
-                self.insights_data["setupInstructions"].append("npm run build")
+                commands["setupInstructions"].append("npm run build")
             if 'test' in scripts:
-                self.insights_data["setupInstructions"].append("npm test")
+                commands["setupInstructions"].append("npm test")
             
-            self.insights_data["setupInstructions"].append("npm install")
+            commands["setupInstructions"].append("npm install")
             
             return result
         except:
             return {}
 
-    def analyze_pip_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_pip_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Python requirements.txt."""
         deps = {}
         try:
@@ -509,7 +900,7 @@ class ComprehensiveProjectAnalyzer:
                     else:
                         deps[line] = "latest"
             
-            self.insights_data["setupInstructions"].extend([
+            commands["setupInstructions"].extend([
                 "python -m venv venv",
                 "venv\\Scripts\\activate (Windows) or source venv/bin/activate (Unix)",
                 "pip install -r requirements.txt"
@@ -517,17 +908,17 @@ class ComprehensiveProjectAnalyzer:
             
             # Check for common Python entry points
             if (self.project_path / "app.py").exists():
-                self.insights_data["runCommands"].append("python app.py")
+                commands["runCommands"].append("python app.py")
             if (self.project_path / "main.py").exists():
-                self.insights_data["runCommands"].append("python main.py")
+                commands["runCommands"].append("python main.py")
             if (self.project_path / "manage.py").exists():
-                self.insights_data["runCommands"].append("python manage.py runserver")
+                commands["runCommands"].append("python manage.py runserver")
             
             return {"dependencies": deps, "total_count": len(deps)}
         except:
             return {}
 
-    def analyze_poetry_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_poetry_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Poetry pyproject.toml."""
         try:
             content = file_path.read_text()
@@ -547,7 +938,7 @@ class ComprehensiveProjectAnalyzer:
                         version = parts[1].strip().strip('"\'')
                         deps[name] = version
             
-            self.insights_data["setupInstructions"].extend([
+            commands["setupInstructions"].extend([
                 "poetry install",
                 "poetry shell"
             ])
@@ -556,7 +947,7 @@ class ComprehensiveProjectAnalyzer:
         except:
             return {}
 
-    def analyze_bundler_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_bundler_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Ruby Gemfile."""
         deps = {}
         try:
@@ -569,44 +960,47 @@ class ComprehensiveProjectAnalyzer:
                         name = parts[1].strip('\'"')
                         deps[name] = "latest"
             
-            self.insights_data["setupInstructions"].append("bundle install")
+            commands["setupInstructions"].append("bundle install")
             return {"dependencies": deps, "total_count": len(deps)}
         except:
             return {}
 
-    def analyze_composer_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_composer_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze PHP composer.json."""
         try:
             data = json.loads(file_path.read_text())
             deps = data.get('require', {})
             
-            self.insights_data["setupInstructions"].append("composer install")
+            commands["setupInstructions"].append("composer install")
             return {"dependencies": deps, "total_count": len(deps)}
         except:
             return {}
 
-    def analyze_maven_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_maven_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Maven pom.xml."""
         deps = {}
         try:
-            content = file_path.read_text()
-            import re
-            pattern = r'<dependency>.*?<groupId>(.*?)</groupId>.*?<artifactId>(.*?)</artifactId>.*?<version>(.*?)</version>.*?</dependency>'
-            matches = re.findall(pattern, content, re.DOTALL)
-            for group, artifact, version in matches:
-                deps[f"{group.strip()}:{artifact.strip()}"] = version.strip()
-            
-            self.insights_data["setupInstructions"].extend([
+            # Streaming parse; pom.xml elements are usually namespaced ("{ns}dependency")
+            for _, elem in ET.iterparse(str(file_path), events=("end",)):
+                if elem.tag == 'dependency' or elem.tag.endswith('}dependency'):
+                    fields = {child.tag.rsplit('}', 1)[-1]: (child.text or '').strip() for child in elem}
+                    group = fields.get('groupId')
+                    artifact = fields.get('artifactId')
+                    if group and artifact:
+                        deps[f"{group}:{artifact}"] = fields.get('version') or "latest"
+                    elem.clear()
+            
+            commands["setupInstructions"].extend([
                 "mvn compile",
                 "mvn test"
             ])
-            self.insights_data["runCommands"].append("mvn spring-boot:run")
+            commands["runCommands"].append("mvn spring-boot:run")
             
             return {"dependencies": deps, "total_count": len(deps)}
         except:
             return {}
 
-    def analyze_gradle_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_gradle_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Gradle build.gradle."""
         deps = {}
         try:
@@ -626,14 +1020,14 @@ class ComprehensiveProjectAnalyzer:
                         group, artifact, version = match.groups()
                         deps[f"{group}:{artifact}"] = version
             
-            self.insights_data["setupInstructions"].append("./gradlew build")
-            self.insights_data["runCommands"].append("./gradlew bootRun")
+            commands["setupInstructions"].append("./gradlew build")
+            commands["runCommands"].append("./gradlew bootRun")
             
             return {"dependencies": deps, "total_count": len(deps)}
         except:
             return {}
 
-    def analyze_cargo_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_cargo_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Rust Cargo.toml."""
         try:
             content = file_path.read_text()
@@ -652,31 +1046,30 @@ class ComprehensiveProjectAnalyzer:
                         version = parts[1].strip().strip('"\'')
                         deps[name] = version
             
-            self.insights_data["setupInstructions"].append("cargo build")
-            self.insights_data["runCommands"].append("cargo run")
+            commands["setupInstructions"].append("cargo build")
+            commands["runCommands"].append("cargo run")
             
             return {"dependencies": deps, "total_count": len(deps)}
         except:
             return {}
 
-    def analyze_go_dependencies(self, file_path: Path) -> Dict[str, Any]:
+    def analyze_go_dependencies(self, file_path: Path, commands: Dict[str, List[str]]) -> Dict[str, Any]:
         """Analyze Go go.mod."""
         deps = {}
         try:
-            content = file_path.read_text()
-            for line in content.splitlines():
-                line = line.strip()
-                if line.startswith('require '):
-                    parts = line.replace('require ', '').split()
+            with file_path.open('r', encoding='utf-8') as f:
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if not line or line.startswith(GO_MOD_SKIP_PREFIXES):
+                        continue
+                    if line.startswith('require '):
+                        line = line[len('require '):]
+                    parts = line.split(None, 2)
                     if len(parts) >= 2:
                         deps[parts[0]] = parts[1]
-                elif line and not line.startswith('module') and not line.startswith('go ') and ' ' in line:
-                    parts = line.split()
-                    if len(parts) >= 2 and not line.startswith('//'):
-                        deps[parts[0]] = parts[1]
             
-            self.insights_data["setupInstructions"].append("go mod download")
-            self.insights_data["runCommands"].append("go run main.go")
+            commands["setupInstructions"].append("go mod download")
+            commands["runCommands"].append("go run main.go")
             
             return {"dependencies": deps, "total_count": len(deps)}
         except:
@@ -686,48 +1079,30 @@ class ComprehensiveProjectAnalyzer:
         """Detect the primary project type."""
         print("🎯 Detecting project type...")
         
-        type_indicators = {
-            "Web Application": [
-                'package.json', 'index.html', 'React', 'Vue.js', 'Angular', 'Express.js',
-                'Next.js', 'Nuxt.js', 'Gatsby', 'Svelte'
-            ],
-            "API/Backend Service": [
-                'Express.js', 'Django', 'Flask', 'FastAPI', 'Spring Framework',
-                'routes/', 'controllers/', 'api/', '/api'
-            ],
-            "Full-Stack Application": [
-                'React', 'Vue.js', 'Angular', 'Express.js', 'Django', 'Flask',
-                'client/', 'server/', 'backend/', 'frontend/'
-            ],
-            "Desktop Application": [
-                'electron', 'tauri', 'PyQt', 'tkinter', '.exe'
-            ],
-            "Mobile Application": [
-                'React Native', 'Flutter', 'Ionic', 'android/', 'ios/'
-            ],
-            "Library/Package": [
-                'setup.py', 'pyproject.toml', 'lib/', 'src/', 'index.js'
-            ],
-            "Documentation": [
-                'docs/', 'README.md', '.md', 'jekyll', 'hugo'
-            ],
-            "Development Environment": [
-                'IDE', 'development environment', 'code editor', 'Monaco', 'AI'
-            ]
-        }
-        
         scores = {}
-        all_indicators = (
-            " ".join(self.insights_data["technologies"]) + " " +
-            " ".join(self.insights_data["configFiles"]) + " " +
-            " ".join(self.insights_data["fileStructure"].keys()) + " " +
-            str(self.insights_data["projectName"]).lower() + " " +
-            str(self.insights_data["projectPath"]).lower()
-        ).lower()
-        
-        for project_type, indicators in type_indicators.items():
-            score = sum(1 for indicator in indicators if indicator.lower() in all_indicators)
-            scores[project_type] = score
+        # Lowercase each source string once; indicators are looked up exactly first,
+        # then as substrings, without joining everything into one large string
+        sources = {name.lower() for name in self.insights_data["technologies"]}
+        sources.update(name.lower() for name in self.insights_data["configFiles"])
+        sources.update(path.lower() for path in self.insights_data["fileStructure"])
+        sources.add(str(self.insights_data["projectName"]).lower())
+        sources.add(str(self.insights_data["projectPath"]).lower())
+        
+        # Several indicators are shared between project types; test each one only once
+        present = {}
+        
+        def is_present(indicator):
+            if indicator not in present:
+                present[indicator] = indicator in sources or any(indicator in source for source in sources)
+            return present[indicator]
+        
+        # Ties go to the earlier type, so stop once no later type can beat the current best
+        best_score = 0
+        for position, (project_type, indicators) in enumerate(_PROJECT_TYPE_INDICATORS_LOWER.items()):
+            scores[project_type] = sum(1 for indicator in indicators if is_present(indicator))
+            best_score = max(best_score, scores[project_type])
+            if best_score >= _PROJECT_TYPE_REMAINING_MAX[position]:
+                break
         
         if scores:
             primary_type = max(scores, key=scores.get)
@@ -744,33 +1119,48 @@ class ComprehensiveProjectAnalyzer:
             if git_dir.exists():
                 self.insights_data["gitInfo"]["isGitRepo"] = True
                 
-                try:
-                    result = subprocess.run(['git', 'branch', '-a'], 
+                def run_git(*args):
+                    result = subprocess.run(['git', *args], 
                                           capture_output=True, text=True, 
                                           cwd=self.project_path, timeout=10)
-                    if result.returncode == 0:
-                        branches = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-                        self.insights_data["gitInfo"]["branchCount"] = len(set(branches))
-                except:
-                    pass
+                    return result.stdout if result.returncode == 0 else None
                 
+                # The queries are independent and dominated by process start-up, so run them concurrently.
+                # One for-each-ref call lists all branches and, via the %(HEAD) marker,
+                # the checked-out commit in the same "%H %s %an %ad" shape as git log
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    refs_future = executor.submit(run_git, 'for-each-ref',
+                                                  '--format=%(HEAD)%00%(objectname) %(subject) %(authorname) %(authordate)',
+                                                  'refs/heads', 'refs/remotes')
+                    count_future = executor.submit(run_git, 'rev-list', '--count', 'HEAD')
+                
+                head_commit = None
                 try:
-                    result = subprocess.run(['git', 'rev-list', '--count', 'HEAD'], 
-                                          capture_output=True, text=True, 
-                                          cwd=self.project_path, timeout=10)
-                    if result.returncode == 0:
-                        self.insights_data["gitInfo"]["commitCount"] = int(result.stdout.strip())
+                    output = refs_future.result()
+                    if output is not None:
+                        refs = [line.split('\0', 1) for line in output.splitlines() if '\0' in line]
+                        self.insights_data["gitInfo"]["branchCount"] = len(refs)
+                        head_commit = next((commit for marker, commit in refs if marker == '*'), None)
                 except:
                     pass
                 
                 try:
-                    result = subprocess.run(['git', 'log', '-1', '--format=%H %s %an %ad'], 
-                                          capture_output=True, text=True, 
-                                          cwd=self.project_path, timeout=10)
-                    if result.returncode == 0:
-                        self.insights_data["gitInfo"]["lastCommit"] = result.stdout.strip()
+                    output = count_future.result()
+                    if output is not None:
+                        self.insights_data["gitInfo"]["commitCount"] = int(output.strip())
                 except:
                     pass
+                
+                if head_commit:
+                    self.insights_data["gitInfo"]["lastCommit"] = head_commit.strip()
+                else:
+                    # Detached HEAD: no branch is marked current
+                    try:
+                        output = run_git('log', '-1', '--format=%H %s %an %ad')
+                        if output is not None:
+                            self.insights_data["gitInfo"]["lastCommit"] = output.strip()
+                    except:
+                        pass
         except:
             pass
 
@@ -828,7 +1218,7 @@ class ComprehensiveProjectAnalyzer:
             recommendations.append("Monitor framework deprecation notices and migration paths")
         
         # Dependency analysis
-        total_deps = sum(deps.get('total_count', 0) for deps in self.insights_data["dependencies"].values())
+        total_deps = self._total_deps
         if total_deps > 200:
             insights.append(f"Very heavy dependency usage: {total_deps} total dependencies")
             recommendations.append("Critical: Implement automated dependency scanning and vulnerability management")
@@ -865,7 +1255,7 @@ class ComprehensiveProjectAnalyzer:
             recommendations.append("Consider implementing a build system for consistent builds")
         
         # Security insights
-        if 'Docker' in self.insights_data["technologies"]:
+        if 'docker' in self._tech_set:
             insights.append("Containerized application using Docker")
             security_findings.append("Ensure Docker images are regularly updated and scanned for vulnerabilities")
             recommendations.append("Implement multi-stage builds and minimal base images")
@@ -874,9 +1264,8 @@ class ComprehensiveProjectAnalyzer:
         auth_deps = []
         for deps_file, deps_data in self.insights_data["dependencies"].items():
             if isinstance(deps_data, dict) and 'dependencies' in deps_data:
-                for dep_name in deps_data['dependencies']:
-                    if any(keyword in dep_name.lower() for keyword in ['auth', 'passport', 'jwt', 'bcrypt', 'crypto']):
-                        auth_deps.append(dep_name)
+                auth_deps.extend(dep_name for dep_name in deps_data['dependencies']
+                                 if AUTH_DEPENDENCY_RE.search(dep_name))
         
         if auth_deps:
             insights.append(f"Authentication/security dependencies detected: {', '.join(auth_deps[:5])}")
@@ -884,16 +1273,15 @@ class ComprehensiveProjectAnalyzer:
             recommendations.append("Implement secure authentication practices and regular security audits")
         
         # Performance insights
-        if any('webpack' in str(deps).lower() for deps in self.insights_data["dependencies"].values()):
+        if 'webpack' in self._all_dep_names:
             performance_insights.append("Webpack detected - consider bundle optimization strategies")
             recommendations.append("Implement code splitting and lazy loading for better performance")
         
-        if any('vite' in str(deps).lower() for deps in self.insights_data["dependencies"].values()):
+        if 'vite' in self._all_dep_names:
             performance_insights.append("Vite detected - modern build tool with good performance defaults")
         
         # Check for image files that might need optimization
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp']
-        if any(ext in self.insights_data["fileTypes"] for ext in image_extensions):
+        if not IMAGE_EXTENSIONS.isdisjoint(self.insights_data["fileTypes"]):
             performance_insights.append("Image files detected - consider implementing image optimization")
             recommendations.append("Implement image optimization and lazy loading")
         
@@ -926,7 +1314,7 @@ class ComprehensiveProjectAnalyzer:
             recommendations.append("Add real-time collaboration features for team development")
         
         self.insights_data["insights"] = insights
-        self.insights_data["recommendations"] = recommendations
+        self.insights_data["recommendations"] = OrderedUniqueList(recommendations)
         self.insights_data["securityFindings"] = security_findings
         self.insights_data["performanceInsights"] = performance_insights
         
@@ -956,7 +1344,7 @@ class ComprehensiveProjectAnalyzer:
                 "buildSystems": self.insights_data["buildSystems"],
                 "testingFrameworks": self.insights_data["testingFrameworks"],
                 "fileTypes": dict(list(self.insights_data["fileTypes"].items())[:10]),
-                "dependencyCount": sum(deps.get('total_count', 0) for deps in self.insights_data["dependencies"].values()),
+                "dependencyCount": self._total_deps,
                 "hasGit": self.insights_data["gitInfo"]["isGitRepo"],
                 "hasTests": len(self.insights_data["testFiles"]) > 0,
                 "hasDocumentation": len(self.insights_data["documentationFiles"]) > 0,
@@ -1002,7 +1390,7 @@ class ComprehensiveProjectAnalyzer:
                 }
             }
             
-            response = requests.post(
+            response = get_http_session().post(
                 f'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-pro:generateContent?key={self.api_key}',
                 headers=headers,
                 json=data,
@@ -1016,10 +1404,9 @@ class ComprehensiveProjectAnalyzer:
                     
                     try:
                         # Extract JSON from response
-                        import re
-                        json_match = re.search(r'\{.*\}', text_response, re.DOTALL)
-                        if json_match:
-                            ai_analysis = json.loads(json_match.group())
+                        json_text = extract_json_object(text_response)
+                        if json_text:
+                            ai_analysis = json.loads(json_text)
                             
                             # Store AI analysis results in insights data
                             self.insights_data["aiSummary"] = ai_analysis.get("summary", "")
@@ -1064,71 +1451,28 @@ class ComprehensiveProjectAnalyzer:
         """Calculate comprehensive code quality metrics."""
         print("📊 Calculating quality metrics...")
         
-        # Define quality factors with weights
-        quality_factors = {
-            "hasTests": {
-                "value": len(self.insights_data["testFiles"]) > 0,
-                "weight": 0.25,
-                "description": "Automated testing implementation"
-            },
-            "hasDocumentation": {
-                "value": len(self.insights_data["documentationFiles"]) > 0,
-                "weight": 0.15,
-                "description": "Project documentation"
-            },
-            "hasGit": {
-                "value": self.insights_data["gitInfo"]["isGitRepo"],
-                "weight": 0.10,
-                "description": "Version control usage"
-            },
-            "hasBuildSystem": {
-                "value": len(self.insights_data["buildSystems"]) > 0,
-                "weight": 0.15,
-                "description": "Build system implementation"
-            },
-            "moderateDependencies": {
-                "value": sum(deps.get('total_count', 0) for deps in self.insights_data["dependencies"].values()) < 150,
-                "weight": 0.10,
-                "description": "Reasonable dependency count"
-            },
-            "hasFrameworks": {
-                "value": len(self.insights_data["frameworks"]) > 0,
-                "weight": 0.10,
-                "description": "Modern framework usage"
-            },
-            "goodFileOrganization": {
-                "value": self.insights_data["totalFiles"] > 5 and len(self.insights_data["fileTypes"]) > 2,
-                "weight": 0.10,
-                "description": "File organization and structure"
-            },
-            "hasTypeScript": {
-                "value": 'TypeScript' in self.insights_data["technologies"],
-                "weight": 0.05,
-                "description": "Type safety implementation"
-            }
-        }
-        
-        # Calculate weighted quality score
-        total_weight = sum(factor["weight"] for factor in quality_factors.values())
-        weighted_score = sum(
-            factor["weight"] * (1 if factor["value"] else 0) 
-            for factor in quality_factors.values()
-        )
-        quality_score = (weighted_score / total_weight) * 10
+        # Single pass over the factor table: score, per-factor results and recommendations
+        weighted_score = 0.0
+        passed_count = 0
+        factors = {}
+        quality_recommendations = []
+        for factor_name, weight, description, check in QUALITY_FACTORS:
+            passed = bool(check(self))
+            factors[factor_name] = {"passed": passed, "description": description}
+            if passed:
+                weighted_score += weight
+                passed_count += 1
+            elif factor_name in QUALITY_RECOMMENDATIONS:
+                quality_recommendations.append(QUALITY_RECOMMENDATIONS[factor_name])
+        quality_score = (weighted_score / QUALITY_TOTAL_WEIGHT) * 10
         
-        # Additional complexity metrics
+        # Additional complexity metrics (size/line aggregates are accumulated during the scan)
         complexity_metrics = {
-            "averageFileSize": (
-                sum(file_info.get("size", 0) for file_info in self.insights_data["fileStructure"].values()) /
-                max(len(self.insights_data["fileStructure"]), 1)
-            ),
-            "averageLinesPerFile": (
-                self.insights_data["totalLinesOfCode"] / 
-                max(len([f for f in self.insights_data["fileStructure"].values() if f.get("lines", 0) > 0]), 1)
-            ),
+            "averageFileSize": self._structure_total_size / max(len(self.insights_data["fileStructure"]), 1),
+            "averageLinesPerFile": self.insights_data["totalLinesOfCode"] / max(self._structure_non_empty_files, 1),
             "fileTypeDistribution": self.insights_data["fileTypes"],
             "dependencyDensity": (
-                sum(deps.get('total_count', 0) for deps in self.insights_data["dependencies"].values()) /
+                self._total_deps /
                 max(self.insights_data["totalLinesOfCode"], 1) * 1000  # Dependencies per 1000 lines
             )
         }
@@ -1136,31 +1480,13 @@ class ComprehensiveProjectAnalyzer:
         self.insights_data["codeQualityMetrics"] = {
             "overallScore": round(quality_score, 1),
             "maxScore": 10.0,
-            "factors": {k: {"passed": v["value"], "description": v["description"]} 
-                      for k, v in quality_factors.items()},
+            "factors": factors,
             "complexity": complexity_metrics,
-            "recommendations": []
+            "recommendations": quality_recommendations
         }
         
-        # Generate quality-specific recommendations
-        quality_recommendations = []
-        for factor_name, factor_data in quality_factors.items():
-            if not factor_data["value"]:
-                if factor_name == "hasTests":
-                    quality_recommendations.append("Implement automated testing with a testing framework")
-                elif factor_name == "hasDocumentation":
-                    quality_recommendations.append("Add comprehensive project documentation")
-                elif factor_name == "hasGit":
-                    quality_recommendations.append("Initialize Git repository for version control")
-                elif factor_name == "hasBuildSystem":
-                    quality_recommendations.append("Implement a build system for consistent builds")
-                elif factor_name == "hasFrameworks":
-                    quality_recommendations.append("Consider adopting modern frameworks for better development experience")
-        
-        self.insights_data["codeQualityMetrics"]["recommendations"] = quality_recommendations
-        
         print(f"📊 Quality score: {quality_score:.1f}/10")
-        print(f"📊 Quality factors passed: {sum(1 for f in quality_factors.values() if f['value'])}/{len(quality_factors)}")
+        print(f"📊 Quality factors passed: {passed_count}/{len(QUALITY_FACTORS)}")
 
     def create_insightsproject_ia_file(self):
         """Create the insightsproject.ia file with all analysis data."""
@@ -1170,14 +1496,16 @@ class ComprehensiveProjectAnalyzer:
             insights_file_path = self.project_path / "insightsproject.ia"
             
             # Update final timestamps
-            self.insights_data["lastModified"] = datetime.now().isoformat()
-            self.insights_data["lastAnalyzed"] = datetime.now().isoformat()
-            
-            # Clean and deduplicate lists
-            self.insights_data["recommendations"] = list(dict.fromkeys(self.insights_data["recommendations"]))  # Remove duplicates while preserving order
-            self.insights_data["setupInstructions"] = list(dict.fromkeys(self.insights_data["setupInstructions"]))
-            self.insights_data["runCommands"] = list(dict.fromkeys(self.insights_data["runCommands"]))
-            self.insights_data["configFiles"] = list(dict.fromkeys(self.insights_data["configFiles"]))
+            now = datetime.now().isoformat()
+            self.insights_data["lastModified"] = now
+            self.insights_data["lastAnalyzed"] = now
+            
+            # File records are slot objects during analysis; convert them to plain dicts for JSON
+            for key in ("importantFiles", "fileStructure"):
+                self.insights_data[key] = {
+                    path: info.to_dict() if hasattr(info, "to_dict") else info
+                    for path, info in self.insights_data[key].items()
+                }
             
             # Ensure all required fields are present
             required_fields = [
@@ -1192,8 +1520,7 @@ class ComprehensiveProjectAnalyzer:
                     self.insights_data[field] = [] if field in ["technologies", "frameworks", "languages", "insights", "recommendations"] else ""
             
             # Write the insights file with proper formatting
-            with open(insights_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.insights_data, f, indent=2, ensure_ascii=False, sort_keys=False)
+            write_json_file(insights_file_path, self.insights_data)
             
             file_size_kb = insights_file_path.stat().st_size / 1024
             
@@ -1216,6 +1543,10 @@ class ComprehensiveProjectAnalyzer:
         print(f"🎯 Target directory: {self.project_path}")
         print("=" * 80)
         
+        # Git analysis only shells out to git and writes gitInfo, so it overlaps steps 1-4
+        git_executor = ThreadPoolExecutor(max_workers=1)
+        git_future = git_executor.submit(self.analyze_git_repository)
+        
         try:
             # Step 1: File scanning
             print("📂 STEP 1: Comprehensive File Scanning")
@@ -1239,7 +1570,7 @@ class ComprehensiveProjectAnalyzer:
             
             # Step 5: Git analysis
             print("📊 STEP 5: Git Repository Analysis")
-            self.analyze_git_repository()
+            git_future.result()
             print()
             
             # Step 6: Generate insights
@@ -1266,38 +1597,47 @@ class ComprehensiveProjectAnalyzer:
             end_time = datetime.now()
             duration = (end_time - self.start_time).total_seconds()
             
-            print("=" * 80)
-            print("✅ COMPREHENSIVE ANALYSIS COMPLETE")
-            print("=" * 80)
-            print(f"📊 Analysis Results Summary:")
-            print(f"   • Project: {self.insights_data['projectName']}")
-            print(f"   • Type: {self.insights_data['projectType']}")
-            print(f"   • Files: {self.insights_data['totalFiles']:,}")
-            print(f"   • Lines of Code: {self.insights_data['totalLinesOfCode']:,}")
-            print(f"   • Technologies: {len(self.insights_data['technologies'])} ({', '.join(self.insights_data['technologies'][:5])}{'...' if len(self.insights_data['technologies']) > 5 else ''})")
-            print(f"   • Languages: {', '.join(self.insights_data['languages']) if self.insights_data['languages'] else 'None detected'}")
-            print(f"   • Frameworks: {', '.join(self.insights_data['frameworks']) if self.insights_data['frameworks'] else 'None detected'}")
-            print(f"   • Dependencies: {sum(deps.get('total_count', 0) for deps in self.insights_data['dependencies'].values())}")
-            print(f"   • Quality Score: {self.insights_data['codeQualityMetrics']['overallScore']}/10")
-            print(f"   • Insights Generated: {len(self.insights_data['insights'])}")
-            print(f"   • Recommendations: {len(self.insights_data['recommendations'])}")
-            print(f"   • Analysis Duration: {duration:.1f} seconds")
+            data = self.insights_data
+            technologies = data['technologies']
+            tech_preview = ', '.join(technologies[:5]) + ('...' if len(technologies) > 5 else '')
             
             if insights_file:
-                print(f"   • insightsproject.ia: ✅ Created successfully")
+                insights_status = "✅ Created successfully"
             else:
-                print(f"   • insightsproject.ia: ❌ Creation failed")
+                insights_status = "❌ Creation failed"
             
             if ai_result and not ai_result.get('error'):
-                print(f"   • AI Analysis: ✅ Completed successfully")
+                ai_status = "✅ Completed successfully"
             elif self.api_key:
-                print(f"   • AI Analysis: ⚠️  Failed - {ai_result.get('error', 'Unknown error')}")
+                ai_status = f"⚠️  Failed - {ai_result.get('error', 'Unknown error')}"
             else:
-                print(f"   • AI Analysis: ⚠️  Skipped (no API key provided)")
-            
-            print("=" * 80)
-            print("🎉 Analysis complete! The insightsproject.ia file contains comprehensive")
-            print("   project data for AI consumption and development insights.")
+                ai_status = "⚠️  Skipped (no API key provided)"
+            
+            # The summary is assembled first and written with a single print call
+            summary_lines = [
+                "=" * 80,
+                "✅ COMPREHENSIVE ANALYSIS COMPLETE",
+                "=" * 80,
+                "📊 Analysis Results Summary:",
+                f"   • Project: {data['projectName']}",
+                f"   • Type: {data['projectType']}",
+                f"   • Files: {data['totalFiles']:,}",
+                f"   • Lines of Code: {data['totalLinesOfCode']:,}",
+                f"   • Technologies: {len(technologies)} ({tech_preview})",
+                f"   • Languages: {', '.join(data['languages']) if data['languages'] else 'None detected'}",
+                f"   • Frameworks: {', '.join(data['frameworks']) if data['frameworks'] else 'None detected'}",
+                f"   • Dependencies: {self._total_deps}",
+                f"   • Quality Score: {data['codeQualityMetrics']['overallScore']}/10",
+                f"   • Insights Generated: {len(data['insights'])}",
+                f"   • Recommendations: {len(data['recommendations'])}",
+                f"   • Analysis Duration: {duration:.1f} seconds",
+                f"   • insightsproject.ia: {insights_status}",
+                f"   • AI Analysis: {ai_status}",
+                "=" * 80,
+                "🎉 Analysis complete! The insightsproject.ia file contains comprehensive",
+                "   project data for AI consumption and development insights.",
+            ]
+            print("\n".join(summary_lines))
             
             return self.insights_data
             
@@ -1306,6 +1646,8 @@ class ComprehensiveProjectAnalyzer:
             import traceback
             traceback.print_exc()
             return None
+        finally:
+            git_executor.shutdown(wait=False)
 
 def main():
     """Main function to run comprehensive analysis."""
@@ -1357,8 +1699,7 @@ Examples:
         # Save additional results if output file specified
         if args.output:
             output_file = Path(args.output)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            write_json_file(output_file, results)
             print(f"📄 Additional results saved to: {output_file}")
             print(f"📊 Output file size: {output_file.stat().st_size / 1024:.1f} KB")
         
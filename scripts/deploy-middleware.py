@@ -12,9 +12,11 @@ import shutil
 from pathlib import Path
 
 def run_command(cmd, cwd=None):
-    """Run a command and return the result"""
+    """Run a command (argv list, no shell) and return the result"""
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+        # Resolve the executable ourselves so Windows .cmd shims like npm.cmd are found without a shell
+        executable = shutil.which(cmd[0]) or cmd[0]
+        result = subprocess.run([executable, *cmd[1:]], cwd=cwd, capture_output=True, text=True)
         if result.returncode != 0:
             print(f"ERROR: {result.stderr}")
             return False
@@ -312,7 +314,7 @@ def deploy_middleware():
     middleware_dir = create_middleware_package()
     
     print("📦 Installing dependencies...")
-    if not run_command("npm install", cwd=middleware_dir):
+    if not run_command(["npm", "install"], cwd=middleware_dir):
         return False
     
     print("✅ Middleware package created successfully!")
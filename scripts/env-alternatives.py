@@ -8,31 +8,35 @@ import os
 import json
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 def show_current_env_location():
     """Show where .env files are located"""
     print("🔍 Environment File Locations:")
     print("=" * 50)
     
-    project_root = Path(__file__).parent.parent
-    print(f"Project root: {project_root.absolute()}")
+    print(f"Project root: {PROJECT_ROOT}")
     
     # Check for .env files
     env_files = [
-        project_root / '.env',
-        project_root / '.env.local',
-        project_root / '.env.development',
-        project_root / '.env.production',
+        PROJECT_ROOT / '.env',
+        PROJECT_ROOT / '.env.local',
+        PROJECT_ROOT / '.env.development',
+        PROJECT_ROOT / '.env.production',
         Path.home() / '.env',
     ]
     
     for env_file in env_files:
-        if env_file.exists():
-            print(f"✅ Found: {env_file.absolute()}")
-            with open(env_file, 'r') as f:
-                lines = f.readlines()
-                print(f"   Lines: {len(lines)}")
-        else:
+        # Open directly instead of exists() + open(); a missing file is the only miss case
+        try:
+            with open(env_file, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
             print(f"❌ Not found: {env_file.absolute()}")
+            continue
+        print(f"✅ Found: {env_file.absolute()}")
+        line_count = content.count(b'\n') + (1 if content and not content.endswith(b'\n') else 0)
+        print(f"   Lines: {line_count}")
     print()
 
 def option1_system_env():
@@ -56,7 +60,7 @@ def option2_config_file():
     print("📋 Option 2: JSON Configuration File")
     print("=" * 50)
     
-    config_file = Path(__file__).parent.parent / 'config.json'
+    config_file = PROJECT_ROOT / 'config.json'
     sample_config = {
         "database": {
             "url": "postgresql://your_database_url",
@@ -84,7 +88,7 @@ def option3_vault_file():
     """Option 3: Encrypted Vault File"""
     print("📋 Option 3: Encrypted Secrets Vault")
     print("=" * 50)
-    vault_file = Path(__file__).parent.parent / 'secrets.vault'
+    vault_file = PROJECT_ROOT / 'secrets.vault'
     print(f"Create encrypted file: {vault_file}")
     print("Use tools like:")
     print("  - ansible-vault")
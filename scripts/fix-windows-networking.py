@@ -3,8 +3,9 @@
 Fix Windows networking issues for LeviatanCode
 """
 
+import os
 import json
-import subprocess
+import socket
 import sys
 from pathlib import Path
 
@@ -52,23 +53,29 @@ def test_port_availability():
     """Test if port 5005 is available"""
     print("[INFO] Testing port availability...")
     
+    # Binding the port ourselves is authoritative and avoids spawning netstat.
+    # On Windows SO_REUSEADDR would let the bind succeed on a busy port, so the probe
+    # asks for exclusive use instead; elsewhere SO_REUSEADDR only lets it bind past
+    # connections from a just-stopped server that are still in TIME_WAIT.
     try:
-        result = subprocess.run(
-            ["netstat", "-an"], 
-            capture_output=True, 
-            text=True, 
-            shell=True
-        )
-        
-        if ":5005" in result.stdout:
-            print("[WARN] Port 5005 may be in use")
-            return False
-        else:
-            print("[OK] Port 5005 is available")
-            return True
-    except:
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
         print("[WARN] Could not check port availability")
         return True
+    
+    try:
+        if os.name == 'nt':
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        probe.bind(("0.0.0.0", 5005))
+        print("[OK] Port 5005 is available")
+        return True
+    except OSError:
+        print("[WARN] Port 5005 may be in use")
+        return False
+    finally:
+        probe.close()
 
 def main():
     """Main function"""
@@ -7,69 +7,341 @@ Creates detailed documentation for AI debugging and development assistance
 
 import os
 import json
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from xxhash import xxh3_128
+except ImportError:
+    xxh3_128 = None
+
+# Bump when the generated metadata format changes so cached files are regenerated
+GENERATOR_VERSION = 2
+
+# Cache keys only detect content changes, so a fast non-cryptographic hash is used
+# when xxhash is installed. The algorithm prefix keeps keys from either one apart.
+CONTENT_HASH_PREFIX = "xx3" if xxh3_128 is not None else "sha256"
+
+# Only the start of very large (bundled/generated) files is analyzed
+MAX_ANALYZE_BYTES = 1024 * 1024
+
+def content_digest(f) -> str:
+    """Return the prefixed cache key for the contents of a binary file object."""
+    digest = hashlib.file_digest(f, xxh3_128 if xxh3_128 is not None else 'sha256')
+    return f"{CONTENT_HASH_PREFIX}:{digest.hexdigest()}"
+
+
+def compile_patterns(specs, flags=re.MULTILINE):
+    """Compile (regex, literals) pairs; each literal tuple lists substrings of which
+    at least one must occur for the regex to be able to match."""
+    return tuple((re.compile(regex, flags), literals) for regex, literals in specs)
+
+
+def find_pattern_matches(patterns, content: str) -> List[Any]:
+    """Run findall for each pattern, skipping those whose literals are absent from content."""
+    matches = []
+    for pattern, literals in patterns:
+        if any(literal in content for literal in literals):
+            matches.extend(pattern.findall(content))
+    return matches
+
+
+# Source patterns for analyze_file_content, compiled once at import
+IMPORT_PATTERNS = compile_patterns((
+    (r"import\s+.*?\s+from\s+['\"]([^'\"]+)['\"]", ("import",)),
+    (r"import\s+['\"]([^'\"]+)['\"]", ("import",)),
+    (r"from\s+([^\s]+)\s+import", ("import",)),
+    (r"require\(['\"]([^'\"]+)['\"]\)", ("require(",)),
+))
+
+EXPORT_PATTERNS = compile_patterns((
+    (r"export\s+(?:default\s+)?(?:class|function|const|let|var)\s+(\w+)", ("export",)),
+    (r"export\s+\{\s*([^}]+)\s*\}", ("export",)),
+    (r"module\.exports\s*=\s*(\w+)", ("module.exports",)),
+))
+
+FUNCTION_PATTERNS = compile_patterns((
+    (r"function\s+(\w+)", ("function",)),
+    (r"const\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*=>", ("=>",)),
+    # Anchored with \b: matches only begin at a word start, so mid-word retries are skipped
+    (r"\b(\w+)\s*:\s*(?:async\s+)?\([^)]*\)\s*=>", ("=>",)),
+    (r"def\s+(\w+)\s*\(", ("def",)),
+))
+
+CLASS_PATTERNS = compile_patterns((
+    (r"class\s+(\w+)", ("class",)),
+    (r"interface\s+(\w+)", ("interface",)),
+    (r"type\s+(\w+)\s*=", ("type",)),
+))
+
+# Only applied to .tsx/.jsx files. The optional leading export/default and the \s*
+# before "()" are left out: they never change the captured name or where a match
+# ends, and without them the engine does not retry those prefixes at every position.
+COMPONENT_PATTERNS = compile_patterns((
+    (r"(?:const|function)\s+(\w+).*?(?:React\.FC|JSX\.Element|\(\s*\)\s*=>)",
+     ("React.FC", "JSX.Element", "=>")),
+    (r"function\s+(\w+)\s*\([^)]*\).*?return", ("return",)),
+), re.MULTILINE | re.DOTALL)
+
+HOOK_PATTERNS = compile_patterns((
+    (r"const\s+(\w*use\w+)\s*=", ("use",)),
+    (r"function\s+(use\w+)\s*\(", ("use",)),
+    (r"export\s+(?:const|function)\s+(use\w+)", ("use",)),
+))
+
+CONFIGURATION_FILE_NAMES = frozenset({'package.json', 'tsconfig.json', 'tailwind.config.ts', 'vite.config.ts'})
+
+# Fallback file type by extension for detect_file_type
+_EXT_TO_TYPE = {
+    '.ts': 'typescript',
+    '.tsx': 'react_component',
+    '.js': 'javascript',
+    '.jsx': 'react_component',
+    '.py': 'python_script',
+    '.json': 'configuration',
+    '.yaml': 'configuration',
+    '.yml': 'configuration',
+    '.toml': 'configuration'
+}
+
+# Purpose templates by file type, filled in with the counts from generate_metadata_content
+_PURPOSE_DESCRIPTIONS = {
+    'component': "React component providing UI functionality. Contains {n_components} component(s) with {lines} lines of JSX/TSX code.",
+    'hook': "Custom React hook providing reusable state logic. Implements {n_hooks} hook(s) for component state management.",
+    'service': "Service layer providing business logic and data operations. Contains {n_functions} function(s) for application services.",
+    'route': "API route handler defining HTTP endpoints and request processing. Implements {n_functions} route handler(s).",
+    'schema': "Data schema definition providing type safety and validation. Defines {n_classes} schema(s) and type(s).",
+    'utility': "Utility functions providing common functionality across the application. Contains {n_functions} utility function(s).",
+    'configuration': "Configuration file defining application settings and build parameters. Contains project configuration and dependencies.",
+    'style': "Stylesheet defining visual appearance and layout. Contains CSS rules for component styling.",
+    'documentation': "Documentation file providing project information and guidance. Contains {lines} lines of documentation."
+}
+
+_DEFAULT_PURPOSE_DESCRIPTION = "Source file containing {lines} lines of code with {n_functions} functions."
+
+# Path keywords checked in order by determine_layer; the first one found wins
+_LAYER_KEYWORDS = (
+    ('components', "Presentation Layer"),
+    ('pages', "Presentation Layer"),
+    ('hooks', "State Management Layer"),
+    ('services', "Service Layer"),
+    ('routes', "API Layer"),
+    ('lib', "Utility Layer"),
+    ('utils', "Utility Layer"),
+    ('shared', "Data Layer"),
+    ('schema', "Data Layer"),
+)
+
+# Static per-file-type lookup tables used by the section helpers below
+_ROLES = {
+    'component': "UI Component",
+    'hook': "State Manager",
+    'service': "Business Logic",
+    'route': "API Handler",
+    'schema': "Data Definition",
+    'utility': "Helper Functions",
+    'configuration': "System Configuration",
+    'style': "Visual Styling",
+    'documentation': "Information Provider"
+}
+
+_PRIMARY_FUNCTIONS = {
+    'component': "Render user interface elements",
+    'hook': "Manage component state and effects",
+    'service': "Handle business logic and data operations",
+    'route': "Process HTTP requests and responses",
+    'schema': "Define data structure and validation",
+    'utility': "Provide common functionality",
+    'configuration': "Configure application behavior",
+    'style': "Define visual appearance",
+    'documentation': "Provide project information"
+}
+
+_COMMON_ISSUES = {
+    'component': """### Rendering Issues
+- **Issue**: Component not updating when props change
+- **Solution**: Check prop dependencies and React re-render triggers
+- **Debug**: Use React DevTools to monitor prop changes
+
+### State Management
+- **Issue**: State not persisting or updating correctly
+- **Solution**: Verify useState and useEffect dependencies
+- **Debug**: Add logging to state update functions""",
+    
+    'hook': """### Hook Rules Violations
+- **Issue**: Hooks called conditionally or in wrong order
+- **Solution**: Follow React hooks rules and call hooks at top level
+- **Debug**: Check ESLint warnings and React error messages
+
+### Dependency Issues
+- **Issue**: useEffect running too frequently or not at all
+- **Solution**: Verify dependency array and memoization
+- **Debug**: Monitor effect execution with logging""",
+    
+    'service': """### API Communication
+- **Issue**: Service calls failing or timing out
+- **Solution**: Check network connectivity and API endpoints
+- **Debug**: Monitor network requests and response codes
+
+### Error Handling
+- **Issue**: Unhandled errors causing application crashes
+- **Solution**: Implement proper try-catch blocks and error boundaries
+- **Debug**: Check error logs and stack traces""",
+    
+    'route': """### Request Processing
+- **Issue**: Routes not responding or returning errors
+- **Solution**: Check route definitions and middleware configuration
+- **Debug**: Monitor server logs and request/response cycle
+
+### Authentication Issues
+- **Issue**: Authentication middleware not working
+- **Solution**: Verify token validation and user session management
+- **Debug**: Check authentication headers and session state"""
+}
+
+_DEFAULT_COMMON_ISSUES = """### General Issues
+- **Issue**: File not loading or executing properly
+- **Solution**: Check syntax and dependency imports
+- **Debug**: Review error messages and stack traces"""
+
+_DEBUG_SCENARIOS = {
+    'component': """1. **Rendering Issues**: Check props, state, and render conditions
+2. **Event Handling**: Verify event handlers and state updates
+3. **Styling Problems**: Check CSS classes and styling logic
+4. **Performance**: Monitor re-renders and optimization""",
+    
+    'hook': """1. **Hook Violations**: Ensure hooks are called at component top level
+2. **Dependency Issues**: Check useEffect and useMemo dependencies
+3. **State Updates**: Verify state is updating correctly
+4. **Memory Leaks**: Check cleanup in useEffect""",
+    
+    'service': """1. **API Failures**: Check network requests and responses
+2. **Data Processing**: Verify data transformation and validation
+3. **Error Handling**: Ensure proper error catching and reporting
+4. **Performance**: Monitor service call latency""",
+    
+    'route': """1. **Route Matching**: Verify route paths and parameters
+2. **Middleware**: Check middleware execution order and configuration
+3. **Request Processing**: Debug request parsing and validation
+4. **Response Issues**: Check response formatting and status codes"""
+}
+
+_DEFAULT_DEBUG_SCENARIOS = """1. **Import Issues**: Check module imports and dependencies
+2. **Syntax Errors**: Verify code syntax and TypeScript types
+3. **Runtime Errors**: Check for null/undefined value handling
+4. **Logic Errors**: Verify business logic and control flow"""
+
+_DEFAULT_INTEGRATION_VERIFICATION = """- All imported modules are available and compatible
+- Exported functions/components are used correctly by consumers
+- Configuration matches expected format and values"""
+
+_INTEGRATION_VERIFICATION = {
+    'component': _DEFAULT_INTEGRATION_VERIFICATION + """
+- Component props match expected interface
+- Event handlers are properly connected""",
+    
+    'service': _DEFAULT_INTEGRATION_VERIFICATION + """
+- API endpoints are accessible and responding
+- Database connections are established"""
+}
 
 class MetadataGenerator:
     def __init__(self, project_path: str = "."):
         self.project_path = Path(project_path).resolve()
         self.metadata_path = self.project_path / "metadata"
+        self.cache_index_path = self.metadata_path / ".cache" / "index.json"
         
         # File patterns to analyze
-        self.source_extensions = {
+        self.source_extensions = frozenset({
             '.ts', '.tsx', '.js', '.jsx', '.py', '.md', '.json',
             '.css', '.scss', '.html', '.yaml', '.yml', '.toml'
-        }
+        })
         
         # Directories to ignore
-        self.ignore_dirs = {
+        self.ignore_dirs = frozenset({
             'node_modules', '.git', '__pycache__', '.venv', 'venv',
             'dist', 'build', '.next', 'target', 'bin', 'obj', 'out',
             '.idea', '.vscode', '.vs', '.nyc_output', 'coverage',
             'logs', 'uploads', 'migrations', 'metadata'
-        }
+        })
 
-    def should_analyze_file(self, file_path: Path) -> bool:
+    def should_analyze_file(self, file_path: Union[str, Path]) -> bool:
         """Check if file should have metadata generated."""
-        if file_path.suffix.lower() not in self.source_extensions:
+        path_str = os.fspath(file_path)
+        name = os.path.basename(path_str)
+        if os.path.splitext(name)[1].lower() not in self.source_extensions:
             return False
         
-        if any(ignore_dir in file_path.parts for ignore_dir in self.ignore_dirs):
+        if not self.ignore_dirs.isdisjoint(os.path.normpath(path_str).split(os.sep)):
             return False
             
-        if file_path.name.startswith('.'):
+        if name.startswith('.'):
             return False
             
         return True
 
-    def detect_file_type(self, file_path: Path) -> str:
-        """Detect the type and purpose of a file."""
-        ext = file_path.suffix.lower()
-        name = file_path.name.lower()
+    def iter_source_files(self):
+        """Yield path strings of files to document, walking the project top-down like os.walk.
+
+        Works on os.scandir entries and plain names; ignored directories are pruned
+        before descending, so no per-file path-part checks are needed.
+        """
+        stack = [str(self.project_path)]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if name not in self.ignore_dirs:
+                                    subdirs.append(entry.path)
+                            elif (not name.startswith('.') and
+                                  os.path.splitext(name)[1].lower() in self.source_extensions):
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
+
+    def detect_file_type(self, file_path: Union[str, Path], path_str: Optional[str] = None) -> str:
+        """Detect the type and purpose of a file.
+
+        path_str is the path as a string; callers that already have it can pass it in.
+        """
+        if path_str is None:
+            path_str = os.fspath(file_path)
+        name = os.path.basename(path_str).lower()
+        ext = os.path.splitext(name)[1]
         
         # Configuration files
-        if name in ['package.json', 'tsconfig.json', 'tailwind.config.ts', 'vite.config.ts']:
+        if name in CONFIGURATION_FILE_NAMES:
             return 'configuration'
         
         # Component files
-        if ext in ['.tsx', '.jsx'] and 'components' in str(file_path):
+        if ext in ('.tsx', '.jsx') and 'components' in path_str:
             return 'component'
         
         # Hook files
-        if ext in ['.ts', '.tsx'] and 'hooks' in str(file_path):
+        if ext in ('.ts', '.tsx') and 'hooks' in path_str:
             return 'hook'
         
         # Page files
-        if ext in ['.tsx', '.jsx'] and 'pages' in str(file_path):
+        if ext in ('.tsx', '.jsx') and 'pages' in path_str:
             return 'page'
         
         # Service files
-        if ext in ['.ts', '.js'] and 'services' in str(file_path):
+        if ext in ('.ts', '.js') and 'services' in path_str:
             return 'service'
         
         # Route files
-        if name.endswith('routes.ts') or 'routes' in str(file_path):
+        if name.endswith('routes.ts') or 'routes' in path_str:
             return 'route'
         
         # Schema files
@@ -77,11 +349,11 @@ class MetadataGenerator:
             return 'schema'
         
         # Utility files
-        if 'utils' in name or 'lib' in str(file_path):
+        if 'utils' in name or 'lib' in path_str:
             return 'utility'
         
         # Style files
-        if ext in ['.css', '.scss']:
+        if ext in ('.css', '.scss'):
             return 'style'
         
         # Documentation
@@ -89,28 +361,28 @@ class MetadataGenerator:
             return 'documentation'
         
         # Default based on extension
-        return {
-            '.ts': 'typescript',
-            '.tsx': 'react_component',
-            '.js': 'javascript',
-            '.jsx': 'react_component',
-            '.py': 'python_script',
-            '.json': 'configuration',
-            '.yaml': 'configuration',
-            '.yml': 'configuration',
-            '.toml': 'configuration'
-        }.get(ext, 'source_file')
-
-    def analyze_file_content(self, file_path: Path) -> Dict[str, Any]:
+        return _EXT_TO_TYPE.get(ext, 'source_file')
+
+    def analyze_file_content(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """Analyze file content to extract metadata."""
+        truncated = False
+        size = None
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            # Read one byte past the cap to tell whether the file was cut off
+            with open(file_path, 'rb') as f:
+                raw = f.read(MAX_ANALYZE_BYTES + 1)
+                if len(raw) > MAX_ANALYZE_BYTES:
+                    truncated = True
+                    raw = raw[:MAX_ANALYZE_BYTES]
+                    size = os.fstat(f.fileno()).st_size
+            content = raw.decode('utf-8', errors='ignore')
         except:
             content = ""
         
         analysis = {
-            'size': len(content),
+            'size': size if truncated else len(content),
             'lines': len(content.splitlines()),
+            'truncated': truncated,
             'imports': [],
             'exports': [],
             'functions': [],
@@ -121,90 +393,43 @@ class MetadataGenerator:
         }
         
         # Analyze imports
-        import_patterns = [
-            r"import\s+.*?\s+from\s+['\"]([^'\"]+)['\"]",
-            r"import\s+['\"]([^'\"]+)['\"]",
-            r"from\s+([^\s]+)\s+import",
-            r"require\(['\"]([^'\"]+)['\"]\)"
-        ]
-        
-        for pattern in import_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            analysis['imports'].extend(matches)
+        analysis['imports'].extend(find_pattern_matches(IMPORT_PATTERNS, content))
         
         # Analyze exports
-        export_patterns = [
-            r"export\s+(?:default\s+)?(?:class|function|const|let|var)\s+(\w+)",
-            r"export\s+\{\s*([^}]+)\s*\}",
-            r"module\.exports\s*=\s*(\w+)"
-        ]
-        
-        for pattern in export_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            for match in matches:
-                if isinstance(match, str):
-                    analysis['exports'].append(match)
-                else:
-                    analysis['exports'].extend([m.strip() for m in match.split(',')])
+        for match in find_pattern_matches(EXPORT_PATTERNS, content):
+            if isinstance(match, str):
+                analysis['exports'].append(match)
+            else:
+                analysis['exports'].extend([m.strip() for m in match.split(',')])
         
         # Analyze functions
-        function_patterns = [
-            r"function\s+(\w+)",
-            r"const\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*=>",
-            r"(\w+)\s*:\s*(?:async\s+)?\([^)]*\)\s*=>",
-            r"def\s+(\w+)\s*\("
-        ]
-        
-        for pattern in function_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            analysis['functions'].extend(matches)
+        analysis['functions'].extend(find_pattern_matches(FUNCTION_PATTERNS, content))
         
         # Analyze classes
-        class_patterns = [
-            r"class\s+(\w+)",
-            r"interface\s+(\w+)",
-            r"type\s+(\w+)\s*="
-        ]
-        
-        for pattern in class_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            analysis['classes'].extend(matches)
+        analysis['classes'].extend(find_pattern_matches(CLASS_PATTERNS, content))
         
         # Analyze React components
-        if file_path.suffix in ['.tsx', '.jsx']:
-            component_patterns = [
-                r"(?:export\s+)?(?:default\s+)?(?:const|function)\s+(\w+).*?(?:React\.FC|JSX\.Element|\s*\(\s*\)\s*=>)",
-                r"(?:export\s+)?(?:default\s+)?function\s+(\w+)\s*\([^)]*\).*?return"
-            ]
-            
-            for pattern in component_patterns:
-                matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
-                analysis['components'].extend(matches)
+        if os.path.splitext(file_path)[1] in ('.tsx', '.jsx'):
+            analysis['components'].extend(find_pattern_matches(COMPONENT_PATTERNS, content))
         
         # Analyze React hooks
-        hook_patterns = [
-            r"const\s+(\w*use\w+)\s*=",
-            r"function\s+(use\w+)\s*\(",
-            r"export\s+(?:const|function)\s+(use\w+)"
-        ]
-        
-        for pattern in hook_patterns:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            analysis['hooks'].extend(matches)
+        analysis['hooks'].extend(find_pattern_matches(HOOK_PATTERNS, content))
         
         return analysis
 
-    def determine_dependencies(self, file_path: Path, analysis: Dict[str, Any]) -> List[str]:
+    def determine_dependencies(self, file_path: Union[str, Path], analysis: Dict[str, Any]) -> List[str]:
         """Determine file dependencies based on imports and usage."""
         dependencies = []
         
         for imp in analysis['imports']:
             if imp.startswith('./') or imp.startswith('../'):
-                # Relative import - resolve to actual file
+                # Relative import - resolve to actual file. Normalized lexically (file_path
+                # is already absolute under the resolved project root), so the only
+                # syscall is the existence check rather than a stat per path component.
                 try:
-                    resolved = (file_path.parent / imp).resolve()
-                    if resolved.exists():
-                        dependencies.append(str(resolved.relative_to(self.project_path)))
+                    resolved = os.path.normpath(os.path.join(os.path.dirname(file_path), imp))
+                    if os.path.exists(resolved):
+                        dependencies.append(str(Path(resolved).relative_to(self.project_path)))
                 except:
                     dependencies.append(imp)
             elif imp.startswith('@/'):
@@ -217,152 +442,128 @@ class MetadataGenerator:
                 # External package or built-in module
                 dependencies.append(imp)
         
-        return list(set(dependencies))
+        # Drop duplicates but keep import order, so the generated lists are stable between runs
+        return list(dict.fromkeys(dependencies))
 
-    def generate_metadata_content(self, file_path: Path) -> str:
-        """Generate comprehensive metadata content for a file."""
-        relative_path = file_path.relative_to(self.project_path)
-        file_type = self.detect_file_type(file_path)
+    def generate_metadata_content(self, file_path: Union[str, Path]) -> str:
+        """Generate comprehensive metadata content for a file (given as a str or Path)."""
+        # Stringify the path once; the type and layer checks are substring tests on it
+        path_str = os.fspath(file_path)
+        path_str_lower = path_str.lower()
+        file_type = self.detect_file_type(file_path, path_str)
         analysis = self.analyze_file_content(file_path)
         dependencies = self.determine_dependencies(file_path, analysis)
         
-        # Generate metadata content
-        content = f"""# {file_path.name} Metadata
-
-## Purpose
-{self.generate_purpose_description(file_path, file_type, analysis)}
-
-## Dependencies
-
-### Imports
-{self.format_list(analysis['imports'][:10])}  # Limited to top 10
-
-### Exports
-{self.format_list(analysis['exports'])}
-
-### File Dependencies
-{self.format_list(dependencies[:15])}  # Limited to top 15
-
-## Object Intent
-
-{self.generate_object_intent(file_path, file_type, analysis)}
-
-## Architecture Context
-
-### Position in System
-- **Layer**: {self.determine_layer(file_path)}
-- **Role**: {self.determine_role(file_path, file_type)}
-- **File Type**: {file_type}
-- **Size**: {analysis['lines']} lines, {analysis['size']} bytes
-
-### Integration Points
-{self.generate_integration_points(file_path, file_type, dependencies)}
-
-## Common Issues
-
-{self.generate_common_issues(file_path, file_type)}
-
-## AI Debugging Guide
-
-### For AI Systems
-1. **File Type**: {file_type.replace('_', ' ').title()}
-2. **Primary Function**: {self.get_primary_function(file_path, file_type)}
-3. **Dependencies**: {len(dependencies)} dependencies detected
-4. **Complexity**: {len(analysis['functions'])} functions, {len(analysis['classes'])} classes/interfaces
-
-### Key Debugging Points
-{self.generate_debugging_points(file_path, file_type, analysis)}
-
-### Dependencies to Monitor
-{self.format_list(dependencies[:5], "- ")}
-
-### Performance Considerations
-{self.generate_performance_notes(file_path, file_type, analysis)}
-
-### Common Debug Scenarios
-{self.generate_debug_scenarios(file_path, file_type)}
-
-### Integration Points to Verify
-{self.generate_integration_verification(file_path, file_type)}
-
-Generated by LeviatanCode Metadata Generator
-"""
-        return content
+        # Counts shared by several sections, computed once
+        ctx = {
+            'lines': analysis['lines'],
+            'n_imports': len(analysis['imports']),
+            'n_functions': len(analysis['functions']),
+            'n_classes': len(analysis['classes']),
+            'n_components': len(analysis['components']),
+            'n_hooks': len(analysis['hooks']),
+            'n_dependencies': len(dependencies),
+        }
+        size_note = " (only the first 1 MB was analyzed)" if analysis['truncated'] else ""
+        
+        # Generate metadata content as a list of lines joined once at the end
+        parts = [
+            f"# {os.path.basename(path_str)} Metadata",
+            "",
+            "## Purpose",
+            self.generate_purpose_description(file_path, file_type, ctx),
+            "",
+            "## Dependencies",
+            "",
+            "### Imports",
+            f"{self.format_list(analysis['imports'][:10])}  # Limited to top 10",
+            "",
+            "### Exports",
+            self.format_list(analysis['exports']),
+            "",
+            "### File Dependencies",
+            f"{self.format_list(dependencies[:15])}  # Limited to top 15",
+            "",
+            "## Object Intent",
+            "",
+            self.generate_object_intent(file_path, file_type, analysis),
+            "",
+            "## Architecture Context",
+            "",
+            "### Position in System",
+            f"- **Layer**: {self.determine_layer(file_path, path_str_lower)}",
+            f"- **Role**: {self.determine_role(file_path, file_type)}",
+            f"- **File Type**: {file_type}",
+            f"- **Size**: {ctx['lines']} lines, {analysis['size']} bytes{size_note}",
+            "",
+            "### Integration Points",
+            self.generate_integration_points(file_path, file_type, dependencies),
+            "",
+            "## Common Issues",
+            "",
+            self.generate_common_issues(file_path, file_type),
+            "",
+            "## AI Debugging Guide",
+            "",
+            "### For AI Systems",
+            f"1. **File Type**: {file_type.replace('_', ' ').title()}",
+            f"2. **Primary Function**: {self.get_primary_function(file_path, file_type)}",
+            f"3. **Dependencies**: {ctx['n_dependencies']} dependencies detected",
+            f"4. **Complexity**: {ctx['n_functions']} functions, {ctx['n_classes']} classes/interfaces",
+            "",
+            "### Key Debugging Points",
+            self.generate_debugging_points(file_path, file_type, ctx),
+            "",
+            "### Dependencies to Monitor",
+            self.format_list(dependencies[:5], "- "),
+            "",
+            "### Performance Considerations",
+            self.generate_performance_notes(file_path, file_type, ctx),
+            "",
+            "### Common Debug Scenarios",
+            self.generate_debug_scenarios(file_path, file_type),
+            "",
+            "### Integration Points to Verify",
+            self.generate_integration_verification(file_path, file_type),
+            "",
+            "Generated by LeviatanCode Metadata Generator",
+            "",
+        ]
+        return "\n".join(parts)
 
     def format_list(self, items: List[str], prefix: str = "- ") -> str:
         """Format a list of items for markdown."""
         if not items:
             return "- None detected"
-        return "\n".join([f"{prefix}{item}" for item in items[:10]])
-
-    def generate_purpose_description(self, file_path: Path, file_type: str, analysis: Dict[str, Any]) -> str:
-        """Generate purpose description based on file type and analysis."""
-        descriptions = {
-            'component': f"React component providing UI functionality. Contains {len(analysis['components'])} component(s) with {analysis['lines']} lines of JSX/TSX code.",
-            'hook': f"Custom React hook providing reusable state logic. Implements {len(analysis['hooks'])} hook(s) for component state management.",
-            'service': f"Service layer providing business logic and data operations. Contains {len(analysis['functions'])} function(s) for application services.",
-            'route': f"API route handler defining HTTP endpoints and request processing. Implements {len(analysis['functions'])} route handler(s).",
-            'schema': f"Data schema definition providing type safety and validation. Defines {len(analysis['classes'])} schema(s) and type(s).",
-            'utility': f"Utility functions providing common functionality across the application. Contains {len(analysis['functions'])} utility function(s).",
-            'configuration': f"Configuration file defining application settings and build parameters. Contains project configuration and dependencies.",
-            'style': f"Stylesheet defining visual appearance and layout. Contains CSS rules for component styling.",
-            'documentation': f"Documentation file providing project information and guidance. Contains {analysis['lines']} lines of documentation."
-        }
+        # One join with the prefix in the separator instead of an f-string per item
+        return prefix + ("\n" + prefix).join(map(str, items[:10]))
+
+    def generate_purpose_description(self, file_path: Union[str, Path], file_type: str, ctx: Dict[str, int]) -> str:
+        """Generate purpose description based on file type and the content counts in ctx."""
+        return _PURPOSE_DESCRIPTIONS.get(file_type, _DEFAULT_PURPOSE_DESCRIPTION).format(**ctx)
+
+    def determine_layer(self, file_path: Union[str, Path], path_str: Optional[str] = None) -> str:
+        """Determine which architectural layer the file belongs to.
+
+        path_str is the lowercased path string, computed here when not given.
+        """
+        if path_str is None:
+            path_str = os.fspath(file_path).lower()
         
-        return descriptions.get(file_type, f"Source file containing {analysis['lines']} lines of code with {len(analysis['functions'])} functions.")
-
-    def determine_layer(self, file_path: Path) -> str:
-        """Determine which architectural layer the file belongs to."""
-        path_str = str(file_path).lower()
-        
-        if 'components' in path_str or 'pages' in path_str:
-            return "Presentation Layer"
-        elif 'hooks' in path_str:
-            return "State Management Layer"
-        elif 'services' in path_str:
-            return "Service Layer"
-        elif 'routes' in path_str:
-            return "API Layer"
-        elif 'lib' in path_str or 'utils' in path_str:
-            return "Utility Layer"
-        elif 'shared' in path_str or 'schema' in path_str:
-            return "Data Layer"
-        else:
-            return "Application Layer"
+        for keyword, layer in _LAYER_KEYWORDS:
+            if keyword in path_str:
+                return layer
+        return "Application Layer"
 
-    def determine_role(self, file_path: Path, file_type: str) -> str:
+    def determine_role(self, file_path: Union[str, Path], file_type: str) -> str:
         """Determine the role of the file in the system."""
-        roles = {
-            'component': "UI Component",
-            'hook': "State Manager",
-            'service': "Business Logic",
-            'route': "API Handler",
-            'schema': "Data Definition",
-            'utility': "Helper Functions",
-            'configuration': "System Configuration",
-            'style': "Visual Styling",
-            'documentation': "Information Provider"
-        }
-        
-        return roles.get(file_type, "Source Code")
+        return _ROLES.get(file_type, "Source Code")
 
-    def get_primary_function(self, file_path: Path, file_type: str) -> str:
+    def get_primary_function(self, file_path: Union[str, Path], file_type: str) -> str:
         """Get the primary function of the file."""
-        functions = {
-            'component': "Render user interface elements",
-            'hook': "Manage component state and effects",
-            'service': "Handle business logic and data operations",
-            'route': "Process HTTP requests and responses",
-            'schema': "Define data structure and validation",
-            'utility': "Provide common functionality",
-            'configuration': "Configure application behavior",
-            'style': "Define visual appearance",
-            'documentation': "Provide project information"
-        }
-        
-        return functions.get(file_type, "Process application logic")
+        return _PRIMARY_FUNCTIONS.get(file_type, "Process application logic")
 
-    def generate_object_intent(self, file_path: Path, file_type: str, analysis: Dict[str, Any]) -> str:
+    def generate_object_intent(self, file_path: Union[str, Path], file_type: str, analysis: Dict[str, Any]) -> str:
         """Generate object intent section."""
         if analysis['components']:
             intent = "### React Components\n"
@@ -381,21 +582,24 @@ Generated by LeviatanCode Metadata Generator
         
         return intent
 
-    def generate_integration_points(self, file_path: Path, file_type: str, dependencies: List[str]) -> str:
+    def generate_integration_points(self, file_path: Union[str, Path], file_type: str, dependencies: List[str]) -> str:
         """Generate integration points section."""
         points = []
         
-        # Check for common integration patterns
-        if any('react' in dep.lower() for dep in dependencies):
+        # Check for common integration patterns. The dependencies are joined into one
+        # lowercased string (no keyword contains a newline, so none can match across two
+        # names) and each keyword becomes a single substring search.
+        haystack = "\n".join(dependencies).lower()
+        if 'react' in haystack:
             points.append("- **React**: Integrates with React component system")
         
-        if any('api' in dep.lower() or 'axios' in dep.lower() for dep in dependencies):
+        if 'api' in haystack or 'axios' in haystack:
             points.append("- **API**: Makes HTTP requests to backend services")
         
-        if any('db' in dep.lower() or 'database' in dep.lower() for dep in dependencies):
+        if 'db' in haystack or 'database' in haystack:
             points.append("- **Database**: Interacts with data storage layer")
         
-        if any('socket' in dep.lower() or 'ws' in dep.lower() for dep in dependencies):
+        if 'socket' in haystack or 'ws' in haystack:
             points.append("- **WebSocket**: Real-time communication integration")
         
         if not points:
@@ -403,79 +607,34 @@ Generated by LeviatanCode Metadata Generator
         
         return "\n".join(points)
 
-    def generate_common_issues(self, file_path: Path, file_type: str) -> str:
+    def generate_common_issues(self, file_path: Union[str, Path], file_type: str) -> str:
         """Generate common issues section."""
-        issues = {
-            'component': """### Rendering Issues
-- **Issue**: Component not updating when props change
-- **Solution**: Check prop dependencies and React re-render triggers
-- **Debug**: Use React DevTools to monitor prop changes
-
-### State Management
-- **Issue**: State not persisting or updating correctly
-- **Solution**: Verify useState and useEffect dependencies
-- **Debug**: Add logging to state update functions""",
-            
-            'hook': """### Hook Rules Violations
-- **Issue**: Hooks called conditionally or in wrong order
-- **Solution**: Follow React hooks rules and call hooks at top level
-- **Debug**: Check ESLint warnings and React error messages
-
-### Dependency Issues
-- **Issue**: useEffect running too frequently or not at all
-- **Solution**: Verify dependency array and memoization
-- **Debug**: Monitor effect execution with logging""",
-            
-            'service': """### API Communication
-- **Issue**: Service calls failing or timing out
-- **Solution**: Check network connectivity and API endpoints
-- **Debug**: Monitor network requests and response codes
-
-### Error Handling
-- **Issue**: Unhandled errors causing application crashes
-- **Solution**: Implement proper try-catch blocks and error boundaries
-- **Debug**: Check error logs and stack traces""",
-            
-            'route': """### Request Processing
-- **Issue**: Routes not responding or returning errors
-- **Solution**: Check route definitions and middleware configuration
-- **Debug**: Monitor server logs and request/response cycle
-
-### Authentication Issues
-- **Issue**: Authentication middleware not working
-- **Solution**: Verify token validation and user session management
-- **Debug**: Check authentication headers and session state"""
-        }
-        
-        return issues.get(file_type, """### General Issues
-- **Issue**: File not loading or executing properly
-- **Solution**: Check syntax and dependency imports
-- **Debug**: Review error messages and stack traces""")
+        return _COMMON_ISSUES.get(file_type, _DEFAULT_COMMON_ISSUES)
 
-    def generate_debugging_points(self, file_path: Path, file_type: str, analysis: Dict[str, Any]) -> str:
+    def generate_debugging_points(self, file_path: Union[str, Path], file_type: str, ctx: Dict[str, int]) -> str:
         """Generate debugging points."""
         points = [
-            f"- Verify all {len(analysis['imports'])} imports are properly resolved",
-            f"- Check {len(analysis['functions'])} functions for proper error handling",
-            f"- Monitor performance with {analysis['lines']} lines of code"
+            f"- Verify all {ctx['n_imports']} imports are properly resolved",
+            f"- Check {ctx['n_functions']} functions for proper error handling",
+            f"- Monitor performance with {ctx['lines']} lines of code"
         ]
         
-        if analysis['components']:
-            points.append(f"- Ensure {len(analysis['components'])} components render correctly")
+        if ctx['n_components']:
+            points.append(f"- Ensure {ctx['n_components']} components render correctly")
         
-        if analysis['hooks']:
-            points.append(f"- Verify {len(analysis['hooks'])} hooks follow React rules")
+        if ctx['n_hooks']:
+            points.append(f"- Verify {ctx['n_hooks']} hooks follow React rules")
         
         return "\n".join(points)
 
-    def generate_performance_notes(self, file_path: Path, file_type: str, analysis: Dict[str, Any]) -> str:
+    def generate_performance_notes(self, file_path: Union[str, Path], file_type: str, ctx: Dict[str, int]) -> str:
         """Generate performance considerations."""
         notes = []
         
-        if analysis['lines'] > 500:
+        if ctx['lines'] > 500:
             notes.append("- Large file size may impact bundle size and load time")
         
-        if len(analysis['functions']) > 20:
+        if ctx['n_functions'] > 20:
             notes.append("- Many functions may indicate need for code splitting")
         
         if file_type == 'component':
@@ -488,51 +647,67 @@ Generated by LeviatanCode Metadata Generator
         
         return "\n".join(notes)
 
-    def generate_debug_scenarios(self, file_path: Path, file_type: str) -> str:
+    def generate_debug_scenarios(self, file_path: Union[str, Path], file_type: str) -> str:
         """Generate common debug scenarios."""
-        scenarios = {
-            'component': """1. **Rendering Issues**: Check props, state, and render conditions
-2. **Event Handling**: Verify event handlers and state updates
-3. **Styling Problems**: Check CSS classes and styling logic
-4. **Performance**: Monitor re-renders and optimization""",
+        return _DEBUG_SCENARIOS.get(file_type, _DEFAULT_DEBUG_SCENARIOS)
+
+    def generate_integration_verification(self, file_path: Union[str, Path], file_type: str) -> str:
+        """Generate integration verification points."""
+        return _INTEGRATION_VERIFICATION.get(file_type, _DEFAULT_INTEGRATION_VERIFICATION)
+
+    def generate_metadata_file(self, file_path: Union[str, Path], cached_digest: Optional[str] = None) -> Tuple[str, str]:
+        """Write the metadata file for one source file.
+
+        Returns ("generated", digest), ("cached", digest) when the source content
+        matches cached_digest and its metadata file still exists, or ("failed", error).
+        """
+        try:
+            # Create corresponding metadata file path
+            relative_path = os.path.relpath(file_path, self.project_path)
+            if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+                raise ValueError(f"{file_path} is not inside {self.project_path}")
+            metadata_file_path = self.metadata_path / f"{relative_path}.md"
             
-            'hook': """1. **Hook Violations**: Ensure hooks are called at component top level
-2. **Dependency Issues**: Check useEffect and useMemo dependencies
-3. **State Updates**: Verify state is updating correctly
-4. **Memory Leaks**: Check cleanup in useEffect""",
+            with open(file_path, 'rb') as f:
+                digest = content_digest(f)
+            if digest == cached_digest and metadata_file_path.exists():
+                return "cached", digest
             
-            'service': """1. **API Failures**: Check network requests and responses
-2. **Data Processing**: Verify data transformation and validation
-3. **Error Handling**: Ensure proper error catching and reporting
-4. **Performance**: Monitor service call latency""",
+            # Generate metadata content
+            metadata_content = self.generate_metadata_content(file_path)
             
-            'route': """1. **Route Matching**: Verify route paths and parameters
-2. **Middleware**: Check middleware execution order and configuration
-3. **Request Processing**: Debug request parsing and validation
-4. **Response Issues**: Check response formatting and status codes"""
-        }
-        
-        return scenarios.get(file_type, """1. **Import Issues**: Check module imports and dependencies
-2. **Syntax Errors**: Verify code syntax and TypeScript types
-3. **Runtime Errors**: Check for null/undefined value handling
-4. **Logic Errors**: Verify business logic and control flow""")
+            # Write metadata file; run_generation pre-creates the directory tree,
+            # so the parent is only created here when called on its own
+            try:
+                metadata_file_path.write_text(metadata_content, encoding='utf-8')
+            except FileNotFoundError:
+                metadata_file_path.parent.mkdir(parents=True, exist_ok=True)
+                metadata_file_path.write_text(metadata_content, encoding='utf-8')
+            return "generated", digest
+        except Exception as e:
+            return "failed", str(e)
 
-    def generate_integration_verification(self, file_path: Path, file_type: str) -> str:
-        """Generate integration verification points."""
-        points = [
-            "- All imported modules are available and compatible",
-            "- Exported functions/components are used correctly by consumers",
-            "- Configuration matches expected format and values"
-        ]
-        
-        if file_type == 'component':
-            points.append("- Component props match expected interface")
-            points.append("- Event handlers are properly connected")
-        elif file_type == 'service':
-            points.append("- API endpoints are accessible and responding")
-            points.append("- Database connections are established")
-        
-        return "\n".join(points)
+    def load_cache_index(self) -> Dict[str, str]:
+        """Load the relative path -> content digest index of the previous run, if it is still valid."""
+        try:
+            with open(self.cache_index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("generator_version") == GENERATOR_VERSION:
+                return index.get("files", {})
+        except:
+            pass
+        return {}
+
+    def save_cache_index(self, files: Dict[str, str]):
+        """Write the cache index atomically so an interrupted run cannot leave it half-written."""
+        try:
+            self.cache_index_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_index_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"generator_version": GENERATOR_VERSION, "files": files}, f)
+            os.replace(temp_path, self.cache_index_path)
+        except OSError as e:
+            print(f"⚠️  Could not save metadata cache index: {e}")
 
     def run_generation(self):
         """Run the complete metadata generation process."""
@@ -543,43 +718,63 @@ Generated by LeviatanCode Metadata Generator
         self.metadata_path.mkdir(exist_ok=True)
         
         # Find all source files
-        source_files = []
-        for root, dirs, files in os.walk(self.project_path):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if d not in self.ignore_dirs]
-            
-            for file in files:
-                file_path = Path(root) / file
-                if self.should_analyze_file(file_path):
-                    source_files.append(file_path)
+        source_files = list(self.iter_source_files())
+        project_root = str(self.project_path)
+        native_relative_paths = [os.path.relpath(file_path, project_root) for file_path in source_files]
+        relative_paths = [relative_path.replace(os.sep, '/') for relative_path in native_relative_paths]
         
         print(f"📊 Found {len(source_files)} files to analyze")
         
-        # Generate metadata for each file
-        generated_count = 0
-        for file_path in source_files:
+        # Create the metadata directory tree once per distinct directory instead
+        # of a mkdir call for every file inside the workers
+        for relative_dir in sorted({os.path.dirname(relative_path) for relative_path in native_relative_paths}):
             try:
-                # Create corresponding metadata file path
-                relative_path = file_path.relative_to(self.project_path)
-                metadata_file_path = self.metadata_path / f"{relative_path}.md"
-                
-                # Create directory structure in metadata folder
-                metadata_file_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Generate metadata content
-                metadata_content = self.generate_metadata_content(file_path)
-                
-                # Write metadata file
-                metadata_file_path.write_text(metadata_content, encoding='utf-8')
-                
-                generated_count += 1
-                print(f"✅ Generated metadata for: {relative_path}")
-                
-            except Exception as e:
-                print(f"❌ Failed to generate metadata for {file_path}: {e}")
+                (self.metadata_path / relative_dir).mkdir(parents=True, exist_ok=True)
+            except OSError:
+                pass
+        
+        # Files whose content hash matches the previous run keep their metadata
+        cached_index = self.load_cache_index()
+        cached_digests = [cached_index.get(relative_path) for relative_path in relative_paths]
+        
+        # Generate metadata for each file. Files are independent and the work is
+        # CPU-bound regex/string processing, so it is spread over worker processes;
+        # map() returns results in input order, keeping the log stable.
+        generated_count = 0
+        cached_count = 0
+        failed_count = 0
+        new_index = {}
+        processed_count = 0
+        try:
+            # Default worker count; an explicit os.cpu_count() fails on Windows above 61 CPUs
+            with ProcessPoolExecutor() as executor:
+                results = executor.map(self.generate_metadata_file, source_files, cached_digests, chunksize=32)
+                for file_path, relative_path, native_relative_path, (status, detail) in zip(
+                        source_files, relative_paths, native_relative_paths, results):
+                    processed_count += 1
+                    if status == "failed":
+                        failed_count += 1
+                        print(f"❌ Failed to generate metadata for {file_path}: {detail}")
+                        continue
+                    new_index[relative_path] = detail
+                    if status == "cached":
+                        cached_count += 1
+                    else:
+                        generated_count += 1
+                        print(f"✅ Generated metadata for: {native_relative_path}")
+        except BrokenProcessPool as e:
+            remaining = len(source_files) - processed_count
+            failed_count += remaining
+            print(f"❌ A worker process terminated abruptly, {remaining} files were not processed: {e}")
+            # Files that were never reached keep their previous entries; their metadata on disk is unchanged
+            for relative_path, cached_digest in zip(relative_paths[processed_count:], cached_digests[processed_count:]):
+                if cached_digest:
+                    new_index[relative_path] = cached_digest
+        
+        self.save_cache_index(new_index)
         
         print(f"\n🎉 Metadata generation complete!")
-        print(f"📊 Generated {generated_count} metadata files")
+        print(f"📊 Generated {generated_count} metadata files ({cached_count} unchanged, {failed_count} failed)")
         print(f"📁 All metadata files available in: {self.metadata_path}")
 
 def main():
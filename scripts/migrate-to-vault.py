@@ -7,6 +7,7 @@ Helps users transition from .env files to the secure vault system
 import os
 import sys
 import json
+import shutil
 from pathlib import Path
 from datetime import datetime
 
@@ -96,8 +97,8 @@ def main():
     
     # Create backup of .env
     backup_file = project_root / f'.env.backup.{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-    with open(env_file, 'r') as src, open(backup_file, 'w') as dst:
-        dst.write(src.read())
+    # copy2 copies in kernel space where supported and keeps the original's mode bits
+    shutil.copy2(env_file, backup_file)
     
     print(f"\n💾 Created backup: {backup_file}")
     
@@ -4,12 +4,17 @@ Quick Windows Setup - Skip Database Step
 For when database is already configured
 """
 
-import os
 import sys
-import json
 import subprocess
+import shutil
 from pathlib import Path
 
+from _setup_common import format_json, load_json_file, write_file_atomic
+from _test_templates import TEST_AI_JS, TEST_DB_JS
+
+# Executable resolved once so commands can run without a shell
+NODE = shutil.which("node") or "node"
+
 # ANSI color codes for Windows console
 class Colors:
     GREEN = '\033[92m'
@@ -21,103 +26,39 @@ class Colors:
 
 def print_colored(text: str, color: str = Colors.WHITE) -> None:
     """Print colored text to console"""
-    print(f"{color}{text}{Colors.END}")
+    sys.stdout.write(f"{color}{text}{Colors.END}\n")
+
+def run_command(cmd: list, check: bool = True, capture: bool = True) -> subprocess.CompletedProcess:
+    """Run command (argv list, no shell) and return result
 
-def run_command(cmd: list, check: bool = True) -> subprocess.CompletedProcess:
-    """Run command and return result"""
+    With capture=False the command writes straight to this console instead of pipes.
+    """
     try:
-        result = subprocess.run(cmd, check=check, capture_output=True, text=True, shell=True)
+        result = subprocess.run(cmd, check=check, capture_output=capture, text=True)
         return result
     except subprocess.CalledProcessError as e:
         print_colored(f"[FAIL] Command failed: {' '.join(cmd)}", Colors.RED)
-        print_colored(f"Error: {e.stderr}", Colors.RED)
+        if e.stderr:
+            print_colored(f"Error: {e.stderr}", Colors.RED)
         raise
 
 def create_test_scripts() -> bool:
     """Create test scripts for validation"""
     print_colored("\n1. Creating Test Scripts...", Colors.CYAN)
     
-    # Test DB script - ASCII safe content
-    test_db_content = '''import { drizzle } from 'drizzle-orm/neon-http';
-import { neon } from '@neondatabase/serverless';
-import 'dotenv/config';
-
-async function testDatabase() {
-    try {
-        const sql = neon(process.env.DATABASE_URL);
-        const db = drizzle(sql);
-        
-        // Test connection
-        const result = await sql`SELECT 1 as test`;
-        console.log('[OK] Database connection successful');
-        
-        // Test basic query
-        const version = await sql`SELECT version()`;
-        console.log('[OK] Database version verified');
-        
-    } catch (error) {
-        console.error('[FAIL] Database connection failed:', error.message);
-        process.exit(1);
-    }
-}
-
-testDatabase();'''
-
-    # Test AI script - ASCII safe content
-    test_ai_content = '''import 'dotenv/config';
-
-async function testAI() {
-    try {
-        if (process.env.OPENAI_API_KEY) {
-            const { default: OpenAI } = await import('openai');
-            const openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
-            
-            const response = await openai.chat.completions.create({
-                model: 'gpt-4o',
-                messages: [{ role: 'user', content: 'Say "OpenAI connection successful"' }],
-                max_tokens: 10
-            });
-            
-            console.log('[OK] OpenAI connection successful');
-            console.log('Response:', response.choices[0].message.content);
-        }
-        
-        if (process.env.GEMINI_API_KEY) {
-            const { GoogleGenAI } = await import('@google/genai');
-            const genAI = new GoogleGenAI({ apiKey: process.env.GEMINI_API_KEY });
-            
-            const response = await genAI.models.generateContent({
-                model: 'gemini-2.5-flash',
-                contents: 'Say "Gemini connection successful"'
-            });
-            
-            console.log('[OK] Gemini connection successful');
-            console.log('Response:', response.text);
-        }
-        
-        if (!process.env.OPENAI_API_KEY && !process.env.GEMINI_API_KEY) {
-            console.log('[INFO] No AI API keys configured');
-        }
-        
-    } catch (error) {
-        console.error('[FAIL] AI service test failed:', error.message);
-    }
-}
-
-testAI();'''
     
     try:
         # Ensure scripts directory exists
         Path("scripts").mkdir(exist_ok=True)
         
-        # Write test scripts with UTF-8 encoding
-        with open("scripts/test-db.js", "w", encoding='utf-8') as f:
-            f.write(test_db_content)
+        # Templates are ASCII only; encoding as ascii fails loudly if that ever changes
+        db_written = write_file_atomic("scripts/test-db.js", TEST_DB_JS, encoding='ascii')
+        ai_written = write_file_atomic("scripts/test-ai.js", TEST_AI_JS, encoding='ascii')
         
-        with open("scripts/test-ai.js", "w", encoding='utf-8') as f:
-            f.write(test_ai_content)
-        
-        print_colored("[OK] Test scripts created", Colors.GREEN)
+        if db_written or ai_written:
+            print_colored("[OK] Test scripts created", Colors.GREEN)
+        else:
+            print_colored("[OK] Test scripts already up to date", Colors.GREEN)
         return True
     except Exception as e:
         print_colored(f"[FAIL] Failed to create test scripts: {e}", Colors.RED)
@@ -129,8 +70,7 @@ def update_package_json() -> bool:
     
     try:
         # Read package.json
-        with open("package.json", "r", encoding='utf-8') as f:
-            package_data = json.load(f)
+        package_data = load_json_file("package.json")
         
         # Add scripts if they don't exist
         if "scripts" not in package_data:
@@ -151,8 +91,7 @@ def update_package_json() -> bool:
         
         if updated:
             # Write updated package.json
-            with open("package.json", "w", encoding='utf-8') as f:
-                json.dump(package_data, f, indent=2)
+            write_file_atomic("package.json", format_json(package_data))
             print_colored("[OK] package.json updated", Colors.GREEN)
         else:
             print_colored("[OK] All scripts already exist", Colors.GREEN)
@@ -167,7 +106,7 @@ def test_database() -> bool:
     print_colored("\n3. Testing Database Connection...", Colors.CYAN)
     
     try:
-        result = run_command(["node", "scripts/test-db.js"], check=False)
+        result = run_command([NODE, "scripts/test-db.js"], check=False, capture=False)
         if result.returncode == 0:
             print_colored("[OK] Database test passed", Colors.GREEN)
             return True
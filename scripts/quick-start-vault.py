@@ -8,11 +8,24 @@ import os
 import sys
 import json
 from pathlib import Path
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = Path.home() / ".leviatancode"
+SECRETS_FILE = APP_DIR / "secrets.encrypted"
+
+# Where the derived vault key is kept between runs (OS keyring, when available)
+KEYRING_SERVICE = "leviatancode"
+KEYRING_KEY_NAME = "vault_key"
+
 def derive_key(password: str, salt: bytes) -> bytes:
     """Derive encryption key from password"""
     kdf = PBKDF2HMAC(
@@ -24,10 +37,42 @@ def derive_key(password: str, salt: bytes) -> bytes:
     key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
     return key
 
-def load_vault_secrets():
-    """Load secrets from encrypted vault and set environment variables"""
-    app_dir = Path.home() / ".leviatancode"
-    secrets_file = app_dir / "secrets.encrypted"
+def get_cached_key():
+    """Return the vault key saved in the OS keyring by a previous run, if any"""
+    if keyring is None:
+        return None
+    try:
+        cached = keyring.get_password(KEYRING_SERVICE, KEYRING_KEY_NAME)
+        return cached.encode() if cached else None
+    except Exception:
+        return None
+
+def cache_key(key: bytes):
+    """Save the derived vault key in the OS keyring so later runs skip PBKDF2"""
+    if keyring is None:
+        return
+    try:
+        keyring.set_password(KEYRING_SERVICE, KEYRING_KEY_NAME, key.decode())
+    except Exception as e:
+        print(f"⚠️  Could not cache vault key in keyring: {e}")
+
+def clear_cached_key():
+    """Remove a saved vault key (stale after a password change, or on --rekey)"""
+    if keyring is None:
+        return
+    try:
+        keyring.delete_password(KEYRING_SERVICE, KEYRING_KEY_NAME)
+    except Exception:
+        pass
+
+def load_vault_secrets(rekey: bool = False):
+    """Load secrets from encrypted vault and set environment variables
+
+    The key derived from the master password is cached in the OS keyring (when the
+    keyring package is installed), so warm starts skip the password prompt and the
+    100k-iteration PBKDF2. rekey=True discards the cached key first.
+    """
+    secrets_file = SECRETS_FILE
     
     if not secrets_file.exists():
         print("❌ No encrypted vault found at:")
@@ -36,18 +81,33 @@ def load_vault_secrets():
         print("   to create your encrypted vault")
         return False
     
-    # Get master password
-    master_password = input("🔐 Enter master password for secrets vault: ")
+    if rekey:
+        clear_cached_key()
     
     try:
-        salt = b'leviatancode_salt_2025'
-        key = derive_key(master_password, salt)
-        cipher_suite = Fernet(key)
-        
         with open(secrets_file, 'rb') as f:
             encrypted_data = f.read()
         
-        decrypted_data = cipher_suite.decrypt(encrypted_data)
+        decrypted_data = None
+        cached_key = get_cached_key()
+        if cached_key:
+            try:
+                decrypted_data = Fernet(cached_key).decrypt(encrypted_data)
+                print("🔑 Unlocked vault with cached key")
+            except (InvalidToken, ValueError):
+                # Vault was re-encrypted with another password; ask again below
+                clear_cached_key()
+        
+        if decrypted_data is None:
+            # Get master password
+            master_password = input("🔐 Enter master password for secrets vault: ")
+            
+            salt = b'leviatancode_salt_2025'
+            vault_key = derive_key(master_password, salt)
+            cipher_suite = Fernet(vault_key)
+            decrypted_data = cipher_suite.decrypt(encrypted_data)
+            cache_key(vault_key)
+        
         data = json.loads(decrypted_data.decode())
         
         secrets = data.get('secrets', {})
@@ -59,7 +119,7 @@ def load_vault_secrets():
         print(f"✅ Loaded {len(secrets)} secrets from encrypted vault")
         
         # Show obfuscated values for verification
-        print("\n🔍 Loaded environment variables:")
+        lines = ["\n🔍 Loaded environment variables:"]
         for key, secret_data in secrets.items():
             value = secret_data.get('value', '')
             # Obfuscate for display
@@ -68,7 +128,9 @@ def load_vault_secrets():
                 display_value = value[:show_chars] + "..." + ("*" * min(10, len(value) - show_chars))
             else:
                 display_value = value
-            print(f"  {key}: {display_value}")
+            lines.append(f"  {key}: {display_value}")
+        # One console write for the whole block instead of one per secret
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return True
         
@@ -82,14 +144,13 @@ def main():
     print("🚀 LeviatanCode Quick Start with Encrypted Vault")
     print("=" * 60)
     
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
     
     # Load vault secrets
-    if not load_vault_secrets():
+    if not load_vault_secrets(rekey='--rekey' in sys.argv):
         print("\n❌ Could not load vault secrets")
         print("\n📋 Alternative: Use .env file")
-        env_file = project_root / '.env'
+        env_file = PROJECT_ROOT / '.env'
         if env_file.exists():
             print(f"   Found .env file: {env_file}")
             print("   Run: npm run dev (to start with .env)")
@@ -6,9 +6,11 @@ Entry point for Windows setup
 
 import os
 import sys
-import subprocess
+import runpy
 from pathlib import Path
 
+SETUP_SCRIPT = "scripts/setup-windows.py"
+
 def print_colored(text: str, color_code: str = "") -> None:
     """Print colored text"""
     if color_code:
@@ -29,24 +31,25 @@ def main():
     Path("scripts").mkdir(exist_ok=True)
     print_colored("✅ Scripts directory ready", "\033[92m")
     
-    # Run the main setup script
-    try:
-        if sys.platform == "win32":
-            # On Windows, use python.exe explicitly
-            result = subprocess.run([sys.executable, "scripts/setup-windows.py"], check=True)
-        else:
-            # On other platforms
-            result = subprocess.run(["python3", "scripts/setup-windows.py"], check=True)
-        
-        print_colored("✨ Setup completed! Run 'npm run windev' to start.", "\033[92m")
-        return result.returncode
-        
-    except subprocess.CalledProcessError as e:
-        print_colored(f"❌ Setup failed with code {e.returncode}", "\033[91m")
-        return e.returncode
-    except FileNotFoundError:
-        print_colored("❌ Python not found. Please install Python 3.8+", "\033[91m")
+    # Run the main setup script in this interpreter rather than a second Python process
+    if not Path(SETUP_SCRIPT).exists():
+        print_colored(f"❌ {SETUP_SCRIPT} not found", "\033[91m")
         return 1
+    
+    sys.argv = [SETUP_SCRIPT] + sys.argv[1:]
+    try:
+        runpy.run_path(SETUP_SCRIPT, run_name="__main__")
+        returncode = 0
+    except SystemExit as e:
+        # The setup script ends with sys.exit(main())
+        returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    
+    if returncode != 0:
+        print_colored(f"❌ Setup failed with code {returncode}", "\033[91m")
+        return returncode
+    
+    print_colored("✨ Setup completed! Run 'npm run windev' to start.", "\033[92m")
+    return 0
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
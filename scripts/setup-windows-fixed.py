@@ -5,12 +5,41 @@ Comprehensive setup for Windows development environment with port 5005
 """
 
 import os
+import re
 import sys
-import json
 import subprocess
 import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional, Tuple, Union
+
+from _setup_common import format_json, load_json_file, write_file_atomic
+from _test_templates import TEST_AI_JS, TEST_DB_JS
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Executables resolved once so commands can run without a shell; on Windows this
+# finds the npm.cmd shim, which CreateProcess can launch by full path
+NODE = shutil.which("node") or "node"
+NPM = shutil.which("npm") or "npm"
+GIT = shutil.which("git") or "git"
+
+AI_PROBE_TIMEOUT = 30
+
+# How much of npm's stderr to show when the install fails
+NPM_ERROR_TAIL_LINES = 20
+
+# drizzle-kit's CLI entry point (its package.json "bin"), run with node directly
+DRIZZLE_KIT_BIN = Path("node_modules") / "drizzle-kit" / "bin.cjs"
+
+# One KEY=value assignment per line; blank lines, comments and lines without '=' never
+# match. Key and value are trimmed of surrounding spaces, the value may contain '='.
+ENV_LINE_RE = re.compile(r'^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
 
 # ANSI color codes for Windows console
 class Colors:
@@ -24,7 +53,7 @@ class Colors:
 
 def print_colored(text: str, color: str = Colors.WHITE) -> None:
     """Print colored text to console"""
-    print(f"{color}{text}{Colors.END}")
+    sys.stdout.write(f"{color}{text}{Colors.END}\n")
 
 def print_header(text: str) -> None:
     """Print section header"""
@@ -32,36 +61,60 @@ def print_header(text: str) -> None:
     print_colored(text, Colors.GREEN)
     print_colored("=" * 50, Colors.GREEN)
 
-def run_command(cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
-    """Run command and return result"""
+def run_command(cmd: Union[str, List[str]], check: bool = True, capture: bool = True) -> subprocess.CompletedProcess:
+    """Run command and return result
+
+    An argv list runs directly without a shell. A string may chain several commands
+    with && and runs in one shell process. With capture=False the command writes
+    straight to this console, so long-running steps show their progress live.
+    """
     try:
-        result = subprocess.run(cmd, check=check, capture_output=True, text=True, shell=True)
+        result = subprocess.run(cmd, check=check, capture_output=capture, text=True, shell=isinstance(cmd, str))
         return result
     except subprocess.CalledProcessError as e:
-        print_colored(f"[FAIL] Command failed: {' '.join(cmd)}", Colors.RED)
-        print_colored(f"Error: {e.stderr}", Colors.RED)
+        command_text = cmd if isinstance(cmd, str) else ' '.join(cmd)
+        print_colored(f"[FAIL] Command failed: {command_text}", Colors.RED)
+        if e.stderr:
+            print_colored(f"Error: {e.stderr}", Colors.RED)
         raise
 
+def get_version(executable: str) -> Optional[str]:
+    """Return the first line of `executable --version`, or None if it cannot run"""
+    try:
+        result = run_command([executable, "--version"], check=False)
+    except OSError:
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return result.stdout.strip().splitlines()[0]
+
 def check_prerequisites() -> bool:
     """Check if required tools are installed"""
     print_colored("\n1. Checking Prerequisites...", Colors.CYAN)
     
-    # Check Node.js
-    try:
-        result = run_command(["node", "--version"])
-        print_colored(f"[OK] Node.js version: {result.stdout.strip()}", Colors.GREEN)
-    except:
+    # Check Node.js and Git with a PATH lookup; no process is started unless
+    # --verbose asks for their versions
+    node_path = shutil.which(NODE)
+    if not node_path:
         print_colored("[FAIL] Node.js not found. Please install Node.js 18+", Colors.RED)
         return False
     
-    # Check Git
-    try:
-        result = run_command(["git", "--version"])
-        print_colored(f"[OK] Git version: {result.stdout.strip()}", Colors.GREEN)
-    except:
+    git_path = shutil.which(GIT)
+    if not git_path:
         print_colored("[FAIL] Git not found. Please install Git", Colors.RED)
         return False
     
+    if '--verbose' in sys.argv:
+        # The two version probes are independent, so both processes start at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            node_future = executor.submit(get_version, node_path)
+            git_future = executor.submit(get_version, git_path)
+            print_colored(f"[OK] Node.js version: {node_future.result() or 'unknown'}", Colors.GREEN)
+            print_colored(f"[OK] Git version: {git_future.result() or 'unknown'}", Colors.GREEN)
+    else:
+        print_colored(f"[OK] Node.js found at: {node_path}", Colors.GREEN)
+        print_colored(f"[OK] Git found at: {git_path}", Colors.GREEN)
+    
     # Check .env file
     if not Path(".env").exists():
         print_colored("[FAIL] .env file not found.", Colors.RED)
@@ -71,31 +124,46 @@ def check_prerequisites() -> bool:
     print_colored("[OK] Prerequisites check completed", Colors.GREEN)
     return True
 
-def install_dependencies() -> bool:
-    """Install npm dependencies"""
-    print_colored("\n2. Installing Dependencies...", Colors.CYAN)
+def start_dependency_install() -> Optional[Tuple[subprocess.Popen, IO[bytes]]]:
+    """Start npm install in the background so local setup steps can run meanwhile
+
+    npm's progress output goes straight to this console. stderr is spooled to a
+    temporary file rather than a pipe: nothing reads it until the install is
+    finished, and a full pipe would stall npm in the meantime.
+    """
+    print_colored("\n2. Installing Dependencies (in background)...", Colors.CYAN)
     
+    stderr_log = tempfile.TemporaryFile()
     try:
-        run_command(["npm", "install"])
-        print_colored("[OK] Dependencies installed", Colors.GREEN)
-        return True
-    except:
-        print_colored("[FAIL] Failed to install dependencies", Colors.RED)
-        return False
+        return subprocess.Popen([NPM, "install"], stderr=stderr_log), stderr_log
+    except Exception as e:
+        stderr_log.close()
+        print_colored(f"[FAIL] Failed to start npm install: {e}", Colors.RED)
+        return None
+
+def finish_dependency_install(install: Tuple[subprocess.Popen, IO[bytes]]) -> bool:
+    """Wait for the background npm install and report its result"""
+    process, stderr_log = install
+    with stderr_log:
+        process.wait()
+        if process.returncode != 0:
+            stderr_log.seek(0)
+            tail = stderr_log.read().decode('utf-8', errors='replace').splitlines()[-NPM_ERROR_TAIL_LINES:]
+            print_colored("[FAIL] Failed to install dependencies", Colors.RED)
+            print_colored("Error: " + "\n".join(tail), Colors.RED)
+            return False
+    
+    print_colored("[OK] Dependencies installed", Colors.GREEN)
+    return True
 
 def load_environment() -> Dict[str, str]:
     """Load environment variables from .env file"""
     print_colored("\n3. Loading Environment Configuration...", Colors.CYAN)
     
-    env_vars = {}
     try:
-        with open(".env", "r", encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    env_vars[key.strip()] = value.strip()
-                    os.environ[key.strip()] = value.strip()
+        text = Path(".env").read_text(encoding='utf-8')
+        env_vars = {match.group(1): match.group(2) for match in ENV_LINE_RE.finditer(text)}
+        os.environ.update(env_vars)
     except Exception as e:
         print_colored(f"[FAIL] Failed to load .env file: {e}", Colors.RED)
         return {}
@@ -124,14 +192,18 @@ def load_environment() -> Dict[str, str]:
 
 def setup_database() -> bool:
     """Setup database migrations"""
-    print_colored("\n4. Setting Up Database...", Colors.CYAN)
+    print_colored("\n5. Setting Up Database...", Colors.CYAN)
     
     try:
-        print_colored("Generating database migrations...", Colors.YELLOW)
-        run_command(["npx", "drizzle-kit", "generate"])
-        
-        print_colored("Running database migrations...", Colors.YELLOW)
-        run_command(["npx", "drizzle-kit", "push"])
+        print_colored("Generating and running database migrations...", Colors.YELLOW)
+        if DRIZZLE_KIT_BIN.exists():
+            # Run the installed CLI with node: one process per step, without the
+            # shell and the npx launcher that resolves the binary on every call
+            run_command([NODE, str(DRIZZLE_KIT_BIN), "generate"], capture=False)
+            run_command([NODE, str(DRIZZLE_KIT_BIN), "push"], capture=False)
+        else:
+            # Both steps run in one shell; push only runs if generate succeeded
+            run_command("npx drizzle-kit generate && npx drizzle-kit push", capture=False)
         
         print_colored("[OK] Database setup completed", Colors.GREEN)
         return True
@@ -141,89 +213,21 @@ def setup_database() -> bool:
 
 def create_test_scripts() -> bool:
     """Create test scripts for validation - ASCII safe"""
-    print_colored("\n5. Creating Test Scripts...", Colors.CYAN)
+    print_colored("\n4. Creating Test Scripts...", Colors.CYAN)
     
-    # Test DB script - ASCII safe content
-    test_db_content = '''import { drizzle } from 'drizzle-orm/neon-http';
-import { neon } from '@neondatabase/serverless';
-import 'dotenv/config';
-
-async function testDatabase() {
-    try {
-        const sql = neon(process.env.DATABASE_URL);
-        const db = drizzle(sql);
-        
-        // Test connection
-        const result = await sql`SELECT 1 as test`;
-        console.log('[OK] Database connection successful');
-        
-        // Test basic query
-        const version = await sql`SELECT version()`;
-        console.log('[OK] Database version verified');
-        
-    } catch (error) {
-        console.error('[FAIL] Database connection failed:', error.message);
-        process.exit(1);
-    }
-}
-
-testDatabase();'''
-
-    # Test AI script - ASCII safe content
-    test_ai_content = '''import 'dotenv/config';
-
-async function testAI() {
-    try {
-        if (process.env.OPENAI_API_KEY) {
-            const { default: OpenAI } = await import('openai');
-            const openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
-            
-            const response = await openai.chat.completions.create({
-                model: 'gpt-4o',
-                messages: [{ role: 'user', content: 'Say "OpenAI connection successful"' }],
-                max_tokens: 10
-            });
-            
-            console.log('[OK] OpenAI connection successful');
-            console.log('Response:', response.choices[0].message.content);
-        }
-        
-        if (process.env.GEMINI_API_KEY) {
-            const { GoogleGenAI } = await import('@google/genai');
-            const genAI = new GoogleGenAI({ apiKey: process.env.GEMINI_API_KEY });
-            
-            const response = await genAI.models.generateContent({
-                model: 'gemini-2.5-flash',
-                contents: 'Say "Gemini connection successful"'
-            });
-            
-            console.log('[OK] Gemini connection successful');
-            console.log('Response:', response.text);
-        }
-        
-        if (!process.env.OPENAI_API_KEY && !process.env.GEMINI_API_KEY) {
-            console.log('[INFO] No AI API keys configured');
-        }
-        
-    } catch (error) {
-        console.error('[FAIL] AI service test failed:', error.message);
-    }
-}
-
-testAI();'''
     
     try:
         # Ensure scripts directory exists
         Path("scripts").mkdir(exist_ok=True)
         
-        # Write test scripts with UTF-8 encoding
-        with open("scripts/test-db.js", "w", encoding='utf-8') as f:
-            f.write(test_db_content)
+        # Templates are ASCII only; encoding as ascii fails loudly if that ever changes
+        db_written = write_file_atomic("scripts/test-db.js", TEST_DB_JS, encoding='ascii')
+        ai_written = write_file_atomic("scripts/test-ai.js", TEST_AI_JS, encoding='ascii')
         
-        with open("scripts/test-ai.js", "w", encoding='utf-8') as f:
-            f.write(test_ai_content)
-        
-        print_colored("[OK] Test scripts created", Colors.GREEN)
+        if db_written or ai_written:
+            print_colored("[OK] Test scripts created", Colors.GREEN)
+        else:
+            print_colored("[OK] Test scripts already up to date", Colors.GREEN)
         return True
     except Exception as e:
         print_colored(f"[FAIL] Failed to create test scripts: {e}", Colors.RED)
@@ -234,20 +238,95 @@ def test_database() -> bool:
     print_colored("\n6. Testing Database Connection...", Colors.CYAN)
     
     try:
-        run_command(["node", "scripts/test-db.js"])
+        run_command([NODE, "scripts/test-db.js"], capture=False)
         return True
     except:
         print_colored("[FAIL] Database connection test failed", Colors.RED)
         return False
 
-def test_ai_services() -> None:
+def probe_openai(api_key: str) -> str:
+    """Send a one-token chat completion to OpenAI and return the reply text"""
+    response = requests.post(
+        "https://api.openai.com/v1/chat/completions",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={
+            "model": "gpt-4o",
+            "messages": [{"role": "user", "content": 'Say "OpenAI connection successful"'}],
+            "max_tokens": 10
+        },
+        timeout=AI_PROBE_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()["choices"][0]["message"]["content"]
+
+def probe_gemini(api_key: str) -> str:
+    """Send a short generateContent request to Gemini and return the reply text"""
+    response = requests.post(
+        "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent",
+        headers={"x-goog-api-key": api_key},
+        json={"contents": [{"parts": [{"text": 'Say "Gemini connection successful"'}]}]},
+        timeout=AI_PROBE_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()["candidates"][0]["content"]["parts"][0]["text"]
+
+def run_in_background(func, *args) -> Future:
+    """Run func(*args) on a daemon thread and return a Future for its result.
+
+    Unlike ThreadPoolExecutor workers, which are joined at interpreter exit, a
+    daemon thread never keeps a failed setup waiting on a slow request.
+    """
+    future = Future()
+    
+    def worker():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+def start_ai_probes() -> Optional[List[Tuple[str, Future]]]:
+    """Start the AI service probes in the background.
+
+    Returns (service name, future) pairs, or None when requests is not installed
+    and test_ai_services has to fall back to the Node test script.
+    """
+    if requests is None:
+        return None
+    
+    probes = []
+    if os.environ.get("OPENAI_API_KEY"):
+        probes.append(("OpenAI", run_in_background(probe_openai, os.environ["OPENAI_API_KEY"])))
+    if os.environ.get("GEMINI_API_KEY"):
+        probes.append(("Gemini", run_in_background(probe_gemini, os.environ["GEMINI_API_KEY"])))
+    return probes
+
+def test_ai_services(probes: Optional[List[Tuple[str, Future]]] = None) -> None:
     """Test AI services"""
     print_colored("\n7. Testing AI Services...", Colors.CYAN)
     
-    try:
-        run_command(["node", "scripts/test-ai.js"], check=False)
-    except:
-        print_colored("AI service test completed with warnings", Colors.YELLOW)
+    if probes is None:
+        try:
+            run_command([NODE, "scripts/test-ai.js"], check=False, capture=False)
+        except:
+            print_colored("AI service test completed with warnings", Colors.YELLOW)
+        return
+    
+    if not probes:
+        print_colored("[INFO] No AI API keys configured", Colors.YELLOW)
+        return
+    
+    for name, future in probes:
+        try:
+            reply = future.result()
+            print_colored(f"[OK] {name} connection successful", Colors.GREEN)
+            print_colored(f"Response: {reply.strip()}", Colors.WHITE)
+        except Exception as e:
+            print_colored(f"[WARN] {name} service test failed: {e}", Colors.YELLOW)
 
 def update_package_json() -> bool:
     """Add useful scripts to package.json"""
@@ -255,8 +334,7 @@ def update_package_json() -> bool:
     
     try:
         # Read package.json
-        with open("package.json", "r", encoding='utf-8') as f:
-            package_data = json.load(f)
+        package_data = load_json_file("package.json")
         
         # Add scripts if they don't exist
         if "scripts" not in package_data:
@@ -268,15 +346,18 @@ def update_package_json() -> bool:
             "windev": "cross-env NODE_ENV=development tsx server/index.ts"
         }
         
+        updated = False
         for script_name, script_command in new_scripts.items():
             if script_name not in package_data["scripts"]:
                 package_data["scripts"][script_name] = script_command
+                updated = True
         
-        # Write updated package.json
-        with open("package.json", "w", encoding='utf-8') as f:
-            json.dump(package_data, f, indent=2)
-        
-        print_colored("[OK] Scripts added to package.json", Colors.GREEN)
+        if updated:
+            # Write updated package.json
+            write_file_atomic("package.json", format_json(package_data))
+            print_colored("[OK] Scripts added to package.json", Colors.GREEN)
+        else:
+            print_colored("[OK] All scripts already exist", Colors.GREEN)
         return True
     except Exception as e:
         print_colored(f"[FAIL] Failed to update package.json: {e}", Colors.RED)
@@ -307,23 +388,37 @@ def main() -> int:
         if not check_prerequisites():
             return 1
         
-        if not install_dependencies():
+        # npm install is mostly network-bound; loading .env and writing the test
+        # scripts do not need node_modules, so they run while it downloads
+        npm_install = start_dependency_install()
+        if npm_install is None:
             return 1
         
         env_vars = load_environment()
-        if not env_vars:
+        test_scripts_created = bool(env_vars) and create_test_scripts()
+        
+        # Always wait for npm, even when a local step failed, so it is never left
+        # running half-way through node_modules when the script exits
+        print_colored("\nWaiting for dependency installation...", Colors.CYAN)
+        if not finish_dependency_install(npm_install):
             return 1
         
-        if not setup_database():
+        if not test_scripts_created:
             return 1
         
-        if not create_test_scripts():
+        # Migrations need drizzle-kit from node_modules
+        if not setup_database():
             return 1
         
+        # The AI probes are plain HTTPS requests, so they run in the background
+        # while the Node database test is in progress; if that test fails the
+        # script exits right away without waiting for them
+        ai_probes = start_ai_probes()
+        
         if not test_database():
             return 1
         
-        test_ai_services()
+        test_ai_services(ai_probes)
         
         if not update_package_json():
             return 1
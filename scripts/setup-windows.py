@@ -24,7 +24,7 @@ class Colors:
 
 def print_colored(text: str, color: str = Colors.WHITE) -> None:
     """Print colored text to console"""
-    print(f"{color}{text}{Colors.END}")
+    sys.stdout.write(f"{color}{text}{Colors.END}\n")
 
 def print_header(text: str) -> None:
     """Print section header"""